@@ -10,17 +10,203 @@ Handles:
 
 from __future__ import annotations
 
+import bisect
+import functools
+import heapq
+import importlib
+import itertools
 import json
+import mmap
+import operator
+import os
 import re
-from collections import defaultdict
+import sqlite3
+import tempfile
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from unreal_python_mcp.unreal_connection import UnrealConnection
 
 
+@functools.cache
+def _optional_module(name: str) -> Any:
+    """
+    Import an optional dependency on first use, or return None if it is not installed.
+
+    Deferring these imports keeps startup of the CLI and server flat no matter
+    which extras are installed.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def json_loads(data: bytes | memoryview | str) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    orjson = _optional_module("orjson")
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 encoded JSON, using orjson when it is installed.
+
+    Args:
+        obj: The object to serialize
+        indent: If True, pretty-print with a 2-space indent
+    """
+    orjson = _optional_module("orjson")
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _is_legacy_class_doc(data: bytes) -> bool:
+    """Whether cached class doc JSON is in the old pretty-printed format (compact JSON has no raw newlines)."""
+    return b"\n" in data
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    Write a file atomically: write to a temp file, fsync, then swap it into place.
+
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+    Each call gets its own temp file, so concurrent writers of one path don't collide.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with open(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+# Shared default for missing member lists, so lookups don't allocate a new empty list
+_EMPTY: tuple = ()
+
+# zstd level for compressed class docs (level 3 is zstd's default speed/ratio trade-off)
+CLASS_DOC_ZSTD_LEVEL = 3
+
+# Maximum number of classes whose basic info is fetched from Unreal per round-trip
+CLASS_INFO_BATCH_SIZE = 200
+
+# Maximum number of full class docs fetched from Unreal per round-trip (a large class is 100KB+)
+CLASS_DOCS_BATCH_SIZE = 20
+
+# Maximum number of class docs kept in memory (least recently used are dropped first)
+CLASS_DOCS_CACHE_SIZE = 128
+
+# Characters that give a search query regex meaning; queries without them are plain substrings
+_REGEX_METACHARS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_query(query: str) -> re.Pattern | None:
+    """
+    Compile a search query as a regex, or None if it is not a valid pattern.
+
+    Queries without uppercase characters are compiled case-sensitively; they
+    are matched against the lowercased names, which avoids IGNORECASE's
+    per-character case folding.
+    """
+    flags = 0 if query == query.lower() else re.IGNORECASE
+    try:
+        return re.compile(query, flags)
+    except re.error:
+        return None
+
+
+class _SearchIndex:
+    """
+    Flattened TOC entries for search_api, built once per TOC.
+
+    Lowercased names are also joined into one NUL-separated string, so a
+    substring query is a few C-level str.find calls over one buffer instead
+    of a Python-level comparison per name. A sorted copy of the lowercased
+    names serves anchored prefix queries with a binary search, and a
+    name-to-index dict answers exact name lookups without any scan.
+    """
+
+    __slots__ = (
+        "names",
+        "names_lower",
+        "entries",
+        "positions",
+        "name_blob",
+        "offsets",
+        "sorted_lower",
+        "sorted_order",
+    )
+
+    def __init__(self, names: list[str], entries: list[str]):
+        self.names = names
+        self.names_lower = [name.lower() for name in names]
+        # Formatted search result line for each name
+        self.entries = entries
+        # Index of each exact name; the first entry wins when a name repeats
+        self.positions = {name: i for i, name in reversed(list(enumerate(names)))}
+        self.name_blob = "".join(f"{name}\x00" for name in self.names_lower)
+        # Start offset of each name in name_blob, plus the end of the blob
+        self.offsets = [0]
+        for name in self.names_lower:
+            self.offsets.append(self.offsets[-1] + len(name) + 1)
+        # Lowercased names in sorted order, and the index of each in names
+        self.sorted_order = sorted(range(len(names)), key=self.names_lower.__getitem__)
+        self.sorted_lower = [self.names_lower[i] for i in self.sorted_order]
+
+    def find_substring(self, query_lower: str, max_results: int) -> list[int]:
+        """Return indexes of names containing query_lower, in index order."""
+        if "\x00" in query_lower:
+            return []
+        return self._find_in_blob(query_lower, max_results)
+
+    def find_suffix(self, suffix_lower: str, max_results: int) -> list[int]:
+        """Return indexes of names ending with suffix_lower, in index order."""
+        if "\x00" in suffix_lower:
+            return []
+        # Each name is followed by a NUL, so a suffix match is a substring match up to it
+        return self._find_in_blob(suffix_lower + "\x00", max_results)
+
+    def _find_in_blob(self, needle: str, max_results: int) -> list[int]:
+        """Return indexes of names whose blob span contains needle, in index order."""
+        matches = []
+        last = len(self.names)
+        pos = 0
+        while len(matches) < max_results:
+            pos = self.name_blob.find(needle, pos)
+            if pos < 0:
+                break
+            i = bisect.bisect_right(self.offsets, pos) - 1
+            if i >= last:
+                break
+            matches.append(i)
+            # Continue from the next name so each name matches at most once
+            pos = self.offsets[i + 1]
+        return matches
+
+    def find_prefix(self, prefix_lower: str, max_results: int) -> list[int]:
+        """Return indexes of names starting with prefix_lower, in index order."""
+        start = bisect.bisect_left(self.sorted_lower, prefix_lower)
+        # Every name with the prefix sorts below prefix + the highest code point
+        end = bisect.bisect_left(self.sorted_lower, prefix_lower + "\U0010ffff", start)
+        return heapq.nsmallest(max_results, self.sorted_order[start:end])
+
+
 # Default cache directory
 def get_cache_dir() -> Path:
     """Get the cache directory path in the current working directory (project-specific)."""
@@ -32,12 +218,40 @@ def get_cache_dir() -> Path:
 class CacheManager:
     """Manages the Unreal Python API documentation cache."""
 
+    __slots__ = (
+        "cache_dir",
+        "_toc_cache",
+        "_llms_index_cache",
+        "_summary_cache",
+        "_modules_listing_cache",
+        "_modules_cache",
+        "_search_index",
+        "_generated_date",
+        "_class_docs_cache",
+        "_member_cache_db",
+        "_member_db_lock",
+        "_unreal_connection",
+        "_lock",
+    )
+
     def __init__(self, cache_dir: Path | None = None, unreal_connection: "UnrealConnection | None" = None):
         self.cache_dir = cache_dir or get_cache_dir()
         self._toc_cache: dict | None = None
         self._llms_index_cache: str | None = None
-        self._class_docs_cache: dict[str, dict] = {}
+        self._summary_cache: str | None = None
+        self._modules_listing_cache: str | None = None
+        self._modules_cache: dict[str, list[str]] | None = None
+        # Built on first search
+        self._search_index: _SearchIndex | None = None
+        # "Generated:" date shown in indexes, read from meta.json on first use
+        self._generated_date: str | None = None
+        self._class_docs_cache: OrderedDict[str, dict] = OrderedDict()
+        self._member_cache_db: sqlite3.Connection | None = None
+        # Serializes all use of the shared member cache connection, which tools reach from worker threads
+        self._member_db_lock = threading.Lock()
         self._unreal_connection: "UnrealConnection | None" = unreal_connection
+        # Guards lazy cache population against the background warm-up thread
+        self._lock = threading.RLock()
 
     def set_unreal_connection(self, conn: "UnrealConnection") -> None:
         """Set the Unreal connection for lazy loading."""
@@ -51,12 +265,40 @@ class CacheManager:
         """Get the path to the cache metadata file."""
         return self.cache_dir / "meta.json"
 
+    def get_modules_path(self) -> Path:
+        """Get the path to the cached module-to-classes mapping."""
+        return self.cache_dir / "modules.json"
+
+    def _get_toc_stamp(self) -> list[int] | None:
+        """Get the modification time and size of toc.json (None if it is missing), which modules.json records."""
+        try:
+            stat = self.get_toc_path().stat()
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
     def get_class_doc_path(self, class_name: str) -> Path:
-        """Get the path to a cached class documentation file."""
+        """
+        Get the path to a cached class documentation file.
+
+        Raises ValueError for names that are not Python identifiers, so a
+        name like "../toc" can never resolve outside the classes directory.
+        """
+        if not class_name.isidentifier():
+            raise ValueError(f"Invalid class name: {class_name!r}")
         classes_dir = self.cache_dir / "classes"
         classes_dir.mkdir(parents=True, exist_ok=True)
         return classes_dir / f"{class_name}.json"
 
+    def get_compressed_class_doc_path(self, class_name: str) -> Path:
+        """Get the path to a zstd-compressed cached class documentation file."""
+        doc_path = self.get_class_doc_path(class_name)
+        return doc_path.with_name(doc_path.name + ".zst")
+
+    def get_member_cache_path(self) -> Path:
+        """Get the path to the SQLite database caching per-member documentation."""
+        return self.cache_dir / "members.sqlite"
+
     def get_llms_index_path(self) -> Path:
         """Get the path to the cached llms.txt file."""
         return self.cache_dir / "llms.txt"
@@ -66,33 +308,87 @@ class CacheManager:
         if self._toc_cache is not None:
             return self._toc_cache
 
-        toc_path = self.get_toc_path()
-        if toc_path.exists():
-            try:
-                with open(toc_path, "r", encoding="utf-8") as f:
-                    self._toc_cache = json.load(f)
+        with self._lock:
+            if self._toc_cache is not None:
                 return self._toc_cache
-            except (json.JSONDecodeError, IOError):
-                pass
-        return None
+
+            toc_path = self.get_toc_path()
+            if toc_path.exists():
+                try:
+                    # Parse straight from the mapped file to avoid copying it into a bytes object first.
+                    # mmap raises ValueError for an empty file, which is treated like a corrupt cache.
+                    with open(toc_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as view:
+                            self._toc_cache = json_loads(view)
+                    return self._toc_cache
+                except (ValueError, IOError):
+                    pass
+            return None
 
     def save_toc(self, toc: dict) -> None:
-        """Save the TOC JSON to cache."""
-        self._toc_cache = toc
-        self._llms_index_cache = None  # Invalidate llms index cache
-
-        toc_path = self.get_toc_path()
-        with open(toc_path, "w", encoding="utf-8") as f:
-            json.dump(toc, f, indent=2)
-
-        # Update metadata
-        meta = {
-            "version": "1.0",
-            "created_at": datetime.now().isoformat(),
-            "toc_entries": sum(len(v) for v in toc.values() if isinstance(v, dict)),
-        }
-        with open(self.get_meta_path(), "w", encoding="utf-8") as f:
-            json.dump(meta, f, indent=2)
+        """
+        Save the TOC JSON to cache.
+
+        Derived indexes are invalidated and regenerated on a background thread,
+        so the first client read after a refresh is served from memory.
+        """
+        with self._lock:
+            self._toc_cache = toc
+            self._invalidate_derived_caches()
+
+            toc_path = self.get_toc_path()
+            _atomic_write(toc_path, json_dumps(toc, indent=True))
+
+            # Persist the module mapping so cold starts don't have to walk the TOC; it is
+            # stamped with the toc.json it was built from, so it is never used with another
+            modules = {"toc": self._get_toc_stamp(), "modules": self.get_modules()}
+            _atomic_write(self.get_modules_path(), json_dumps(modules))
+
+            # Update metadata
+            now = datetime.now()
+            self._generated_date = now.strftime("%Y-%m-%d")
+            meta = {
+                "version": "1.0",
+                "created_at": now.isoformat(),
+                "generated_date": self._generated_date,
+                "toc_entries": sum(len(v) for v in toc.values() if isinstance(v, dict)),
+            }
+            _atomic_write(self.get_meta_path(), json_dumps(meta, indent=True))
+
+        threading.Thread(target=self._warm_caches, name="unreal-python-mcp-warmup").start()
+
+    def _invalidate_derived_caches(self) -> None:
+        """Drop everything generated from the TOC, in memory and on disk."""
+        with self._lock:
+            self._llms_index_cache = None
+            self._summary_cache = None
+            self._modules_listing_cache = None
+            self._modules_cache = None
+            self._search_index = None
+            for path in (self.get_llms_index_path(), self.get_modules_path()):
+                path.unlink(missing_ok=True)
+
+    def _warm_caches(self) -> None:
+        """Populate the memoized indexes ahead of the first client request."""
+        self.get_modules()
+        self.get_summary()
+        self.get_llms_index()
+        self._get_search_index()
+
+    def _get_generated_date(self) -> str:
+        """Get the date the TOC was cached, as shown in the generated indexes."""
+        if self._generated_date is None:
+            generated_date = None
+            meta_path = self.get_meta_path()
+            if meta_path.exists():
+                try:
+                    with open(meta_path, "rb") as f:
+                        generated_date = json_loads(f.read()).get("generated_date")
+                except (ValueError, IOError):
+                    pass
+            # Caches written before the date was stored fall back to today
+            self._generated_date = generated_date or datetime.now().strftime("%Y-%m-%d")
+        return self._generated_date
 
     def get_llms_index(self) -> str:
         """
@@ -104,27 +400,31 @@ class CacheManager:
         if self._llms_index_cache is not None:
             return self._llms_index_cache
 
-        # Try to load from file
-        llms_path = self.get_llms_index_path()
-        if llms_path.exists():
-            try:
-                with open(llms_path, "r", encoding="utf-8") as f:
-                    self._llms_index_cache = f.read()
+        with self._lock:
+            if self._llms_index_cache is not None:
                 return self._llms_index_cache
-            except IOError:
-                pass
 
-        # Generate from TOC
-        toc = self.load_toc()
-        if toc:
-            self._llms_index_cache = self._generate_llms_index(toc)
-            # Save to file
-            with open(llms_path, "w", encoding="utf-8") as f:
-                f.write(self._llms_index_cache)
-            return self._llms_index_cache
+            # Try to load from file
+            llms_path = self.get_llms_index_path()
+            if llms_path.exists():
+                try:
+                    # Binary read pulls the whole file in one go; decode once at the end
+                    with open(llms_path, "rb") as f:
+                        self._llms_index_cache = f.read().decode("utf-8")
+                    return self._llms_index_cache
+                except (UnicodeDecodeError, IOError):
+                    pass
+
+            # Generate from TOC
+            toc = self.load_toc()
+            if toc:
+                self._llms_index_cache = self._generate_llms_index(toc)
+                # Save to file
+                _atomic_write(llms_path, self._llms_index_cache.encode("utf-8"))
+                return self._llms_index_cache
 
-        # Return placeholder
-        return self._get_placeholder_llms_index()
+            # Return placeholder
+            return self._get_placeholder_llms_index()
 
     def _get_placeholder_llms_index(self) -> str:
         """Return a placeholder llms.txt when no cache is available."""
@@ -164,7 +464,7 @@ class CacheManager:
         """
         lines = [
             "# Unreal Python API",
-            f"> Generated: {datetime.now().strftime('%Y-%m-%d')}",
+            f"> Generated: {self._get_generated_date()}",
             "",
         ]
 
@@ -172,9 +472,11 @@ class CacheManager:
         if "Class" in toc and toc["Class"]:
             lines.append("## Classes")
             lines.append("")
-            for class_name, members in sorted(toc["Class"].items()):
-                func_count = len(members.get("func", []))
-                prop_count = len(members.get("prop", []))
+            classes = toc["Class"]
+            for class_name in sorted(classes):
+                members = classes[class_name]
+                func_count = len(members.get("func", _EMPTY))
+                prop_count = len(members.get("prop", _EMPTY))
                 lines.append(f"- [{class_name}](/class/{class_name}): {func_count} methods, {prop_count} properties")
             lines.append("")
 
@@ -182,8 +484,10 @@ class CacheManager:
         if "Enum" in toc and toc["Enum"]:
             lines.append("## Enums")
             lines.append("")
-            for enum_name, members in sorted(toc["Enum"].items()):
-                const_count = len(members.get("const", []))
+            enums = toc["Enum"]
+            for enum_name in sorted(enums):
+                members = enums[enum_name]
+                const_count = len(members.get("const", _EMPTY))
                 lines.append(f"- [{enum_name}](/enum/{enum_name}): {const_count} values")
             lines.append("")
 
@@ -191,8 +495,10 @@ class CacheManager:
         if "Struct" in toc and toc["Struct"]:
             lines.append("## Structs")
             lines.append("")
-            for struct_name, members in sorted(toc["Struct"].items()):
-                prop_count = len(members.get("prop", []))
+            structs = toc["Struct"]
+            for struct_name in sorted(structs):
+                members = structs[struct_name]
+                prop_count = len(members.get("prop", _EMPTY))
                 lines.append(f"- [{struct_name}](/struct/{struct_name}): {prop_count} properties")
             lines.append("")
 
@@ -200,7 +506,7 @@ class CacheManager:
         if "Delegate" in toc and toc["Delegate"]:
             lines.append("## Delegates")
             lines.append("")
-            for delegate_name in sorted(toc["Delegate"].keys()):
+            for delegate_name in sorted(toc["Delegate"]):
                 lines.append(f"- [{delegate_name}](/delegate/{delegate_name})")
             lines.append("")
 
@@ -208,61 +514,96 @@ class CacheManager:
         if "Native" in toc and toc["Native"]:
             lines.append("## Functions")
             lines.append("")
-            for func_name in sorted(toc["Native"].keys()):
+            for func_name in sorted(toc["Native"]):
                 lines.append(f"- [{func_name}](/func/{func_name})")
             lines.append("")
 
         return "\n".join(lines)
 
+    def _get_search_index(self) -> _SearchIndex | None:
+        """Get the search index, building it from the TOC on first use (None if there is no TOC)."""
+        if self._search_index is not None:
+            return self._search_index
+
+        with self._lock:
+            if self._search_index is None:
+                toc = self.load_toc()
+                if toc:
+                    self._search_index = self._build_search_index(toc)
+            return self._search_index
+
+    def _build_search_index(self, toc: dict) -> _SearchIndex:
+        """
+        Flatten the TOC into a search index.
+
+        Result lines, including member counts, are formatted once here,
+        so each search only has to compare strings.
+        """
+        names = []
+        entries = []
+        for category, items in toc.items():
+            if not isinstance(items, dict):
+                continue
+
+            for name, members in items.items():
+                member_info = []
+                if members.get("func"):
+                    member_info.append(f"{len(members['func'])} methods")
+                if members.get("prop"):
+                    member_info.append(f"{len(members['prop'])} props")
+                if members.get("const"):
+                    member_info.append(f"{len(members['const'])} consts")
+
+                info = f"[{category}] {name}"
+                if member_info:
+                    info += f" ({', '.join(member_info)})"
+                names.append(name)
+                entries.append(info)
+        return _SearchIndex(names, entries)
+
     def search_api(self, query: str, max_results: int = 20) -> list[str]:
         """
         Search the API index for matching entries.
 
         Args:
-            query: Search query (supports partial matching and regex)
+            query: Search query (supports partial matching and regex).
+                An exact class/function name returns only that entry.
             max_results: Maximum number of results to return
         """
-        toc = self.load_toc()
-        if not toc:
+        index = self._get_search_index()
+        if index is None:
             return ["Cache not initialized. Use refresh_api_cache tool first."]
 
+        # An exact, case-sensitive name is answered directly with just that entry
+        exact = index.positions.get(query)
+        if exact is not None:
+            return [index.entries[exact]]
+
+        # Literal queries, optionally anchored at one end, skip the regex engine entirely
+        if not _REGEX_METACHARS.search(query):
+            matches = index.find_substring(query.lower(), max_results)
+            return [index.entries[i] for i in matches]
+        if query.startswith("^") and not _REGEX_METACHARS.search(query, 1):
+            matches = index.find_prefix(query[1:].lower(), max_results)
+            return [index.entries[i] for i in matches]
+        if query.endswith("$") and not _REGEX_METACHARS.search(query, 0, len(query) - 1):
+            matches = index.find_suffix(query[:-1].lower(), max_results)
+            return [index.entries[i] for i in matches]
+
+        # If invalid regex, use simple substring matching
+        pattern = _compile_query(query)
+        if pattern is None:
+            matches = index.find_substring(query.lower(), max_results)
+            return [index.entries[i] for i in matches]
+
+        # Case-sensitive patterns come from lowercase queries; match them against lowercased names
+        names = index.names if pattern.flags & re.IGNORECASE else index.names_lower
         results = []
-        try:
-            pattern = re.compile(query, re.IGNORECASE)
-        except re.error:
-            # If invalid regex, use simple substring matching
-            pattern = None
-
-        for category, items in toc.items():
-            if not isinstance(items, dict):
-                continue
-
-            for name, members in items.items():
-                matched = False
-                if pattern:
-                    matched = pattern.search(name) is not None
-                else:
-                    matched = query.lower() in name.lower()
-
-                if matched:
-                    member_info = []
-                    if members.get("func"):
-                        member_info.append(f"{len(members['func'])} methods")
-                    if members.get("prop"):
-                        member_info.append(f"{len(members['prop'])} props")
-                    if members.get("const"):
-                        member_info.append(f"{len(members['const'])} consts")
-
-                    info = f"[{category}] {name}"
-                    if member_info:
-                        info += f" ({', '.join(member_info)})"
-                    results.append(info)
-
-                    if len(results) >= max_results:
-                        break
-
-            if len(results) >= max_results:
-                break
+        for name, entry in zip(names, index.entries):
+            if pattern.search(name) is not None:
+                results.append(entry)
+                if len(results) >= max_results:
+                    break
 
         return results
 
@@ -271,41 +612,165 @@ class CacheManager:
         Get detailed documentation for a class.
 
         First checks memory cache, then file cache, then fetches from Unreal.
+        Names that are not valid identifiers are never looked up and return None.
         """
+        if not class_name.isidentifier():
+            return None
+
         # Check memory cache
-        if class_name in self._class_docs_cache:
-            return self._class_docs_cache[class_name]
+        doc = self._cached_class_doc(class_name)
+        if doc is not None:
+            return doc
+
+        doc = self._load_class_doc_uncached(class_name)
+        if doc is not None:
+            self._remember_class_doc(class_name, doc)
+        return doc
+
+    def get_class_docs(self, class_names: list[str]) -> dict[str, dict]:
+        """
+        Get detailed documentation for multiple classes at once (batch operation).
+
+        Docs in the memory or file cache are used as is; the rest are fetched
+        from Unreal in round-trips of up to CLASS_DOCS_BATCH_SIZE classes each.
+
+        Args:
+            class_names: The class names
+
+        Returns:
+            Dict mapping class name to documentation, in request order
+            (skips classes that couldn't be found or aren't valid identifiers)
+        """
+        class_names = [name for name in dict.fromkeys(class_names) if name.isidentifier()]
+        found = {}
+        missing = []
+        for class_name in class_names:
+            doc = self._cached_class_doc(class_name)
+            if doc is None:
+                doc = self._load_class_doc_file(class_name)
+                if doc is not None:
+                    self._remember_class_doc(class_name, doc)
+            if doc is not None:
+                found[class_name] = doc
+            else:
+                missing.append(class_name)
+
+        if missing and self._unreal_connection is not None:
+            for start in range(0, len(missing), CLASS_DOCS_BATCH_SIZE):
+                batch = missing[start:start + CLASS_DOCS_BATCH_SIZE]
+                fetched = self._unreal_connection.fetch_class_docs(batch)
+                if not fetched:
+                    continue
+                for class_name, doc in fetched.items():
+                    if doc:
+                        self.save_class_doc(class_name, doc)
+                        found[class_name] = doc
+
+        return {name: found[name] for name in class_names if name in found}
+
+    def get_class_doc_raw(self, class_name: str) -> str | None:
+        """
+        Get detailed documentation for a class as a JSON string.
+
+        Compact cached files are returned as stored, without parsing; legacy
+        pretty-printed files are migrated, and missing docs are fetched from
+        Unreal (and cached), via get_class_doc.
+        """
+        if not class_name.isidentifier():
+            return None
+
+        data = self._read_class_doc_file(class_name)
+        if data is not None and not _is_legacy_class_doc(data):
+            return data.decode("utf-8")
+
+        doc = self.get_class_doc(class_name)
+        if doc is None:
+            return None
+        return json_dumps(doc).decode("utf-8")
+
+    def _read_class_doc_file(self, class_name: str) -> bytes | None:
+        """Read the cached JSON bytes for a class doc, or None if it is not on disk."""
+        zstandard = _optional_module("zstandard")
+        # Check compressed file cache
+        if zstandard is not None:
+            zst_path = self.get_compressed_class_doc_path(class_name)
+            if zst_path.exists():
+                try:
+                    with open(zst_path, "rb") as f:
+                        return zstandard.decompress(f.read())
+                except (zstandard.ZstdError, IOError):
+                    pass
 
         # Check file cache
         doc_path = self.get_class_doc_path(class_name)
         if doc_path.exists():
             try:
-                with open(doc_path, "r", encoding="utf-8") as f:
-                    doc = json.load(f)
-                self._class_docs_cache[class_name] = doc
-                return doc
-            except (json.JSONDecodeError, IOError):
+                with open(doc_path, "rb") as f:
+                    return f.read()
+            except IOError:
                 pass
 
+        return None
+
+    def _load_class_doc_file(self, class_name: str) -> dict | None:
+        """Load class documentation from the file cache, or None if it is not on disk."""
+        data = self._read_class_doc_file(class_name)
+        if data is None:
+            return None
+        try:
+            doc = json_loads(data)
+        except ValueError:
+            return None
+        if _is_legacy_class_doc(data) or (
+            _optional_module("zstandard") is not None and self.get_class_doc_path(class_name).exists()
+        ):
+            # Migrate pretty-printed and uncompressed docs as they are read
+            self.save_class_doc(class_name, doc)
+        return doc
+
+    def _load_class_doc_uncached(self, class_name: str) -> dict | None:
+        """Load class documentation from the file cache, or fetch it from Unreal."""
+        doc = self._load_class_doc_file(class_name)
+        if doc is not None:
+            return doc
+
         # Fetch from Unreal (lazy loading)
         if self._unreal_connection is not None:
-            doc_json = self._unreal_connection.fetch_class_doc(class_name)
-            if doc_json:
-                try:
-                    doc = json.loads(doc_json)
-                    self.save_class_doc(class_name, doc)
-                    return doc
-                except json.JSONDecodeError:
-                    pass
+            doc = self._unreal_connection.fetch_class_doc(class_name)
+            if doc:
+                self.save_class_doc(class_name, doc)
+                return doc
 
         return None
 
+    def _cached_class_doc(self, class_name: str) -> dict | None:
+        """Return a class doc from the memory cache (marking it recently used), or None."""
+        with self._lock:
+            doc = self._class_docs_cache.get(class_name)
+            if doc is not None:
+                self._class_docs_cache.move_to_end(class_name)
+            return doc
+
+    def _remember_class_doc(self, class_name: str, doc: dict) -> None:
+        """Keep a class doc in the memory cache, evicting the least recently used beyond the limit."""
+        with self._lock:
+            self._class_docs_cache[class_name] = doc
+            self._class_docs_cache.move_to_end(class_name)
+            while len(self._class_docs_cache) > CLASS_DOCS_CACHE_SIZE:
+                self._class_docs_cache.popitem(last=False)
+
     def save_class_doc(self, class_name: str, doc: dict) -> None:
-        """Save class documentation to cache."""
-        self._class_docs_cache[class_name] = doc
+        """Save class documentation to cache (zstd-compressed when zstandard is installed)."""
         doc_path = self.get_class_doc_path(class_name)
-        with open(doc_path, "w", encoding="utf-8") as f:
-            json.dump(doc, f, indent=2)
+        self._remember_class_doc(class_name, doc)
+        zstandard = _optional_module("zstandard")
+        if zstandard is None:
+            _atomic_write(doc_path, json_dumps(doc))
+            return
+
+        data = zstandard.compress(json_dumps(doc), CLASS_DOC_ZSTD_LEVEL)
+        _atomic_write(self.get_compressed_class_doc_path(class_name), data)
+        doc_path.unlink(missing_ok=True)
 
     def refresh_from_unreal(self, conn: "UnrealConnection") -> None:
         """
@@ -314,17 +779,22 @@ class CacheManager:
         Args:
             conn: UnrealConnection instance for communicating with Unreal
         """
-        # Fetch TOC
-        toc_json = conn.fetch_toc()
-        if toc_json:
-            toc = json.loads(toc_json)
+        # Class info memoized by the connection may be stale after an editor change
+        conn.invalidate_cache()
+
+        # Fetch TOC (saving it also clears and regenerates the derived indexes)
+        toc = conn.fetch_toc()
+        if toc:
             self.save_toc(toc)
+        else:
+            self._invalidate_derived_caches()
 
-        # Clear llms index cache to regenerate
-        self._llms_index_cache = None
-        llms_path = self.get_llms_index_path()
-        if llms_path.exists():
-            llms_path.unlink()
+        # Member docs may have changed along with the TOC
+        try:
+            with self._member_db_lock, self._get_member_db() as db:
+                db.execute("DELETE FROM members")
+        except sqlite3.Error:
+            pass
 
     # ========================================================================
     # Hierarchical Index Generation
@@ -335,28 +805,48 @@ class CacheManager:
         Get a mapping of module names to class names.
 
         Includes both Class and Native categories (Native includes custom modules).
+        modules.json is only used while toc.json is the one it was built from.
 
         Returns:
             Dict mapping module name to list of class names
         """
-        toc = self.load_toc()
-        if not toc:
-            return {}
-
-        modules: dict[str, list[str]] = defaultdict(list)
+        if self._modules_cache is not None:
+            return self._modules_cache
 
-        # Process both Class and Native categories
-        for category in ["Class", "Native"]:
-            classes = toc.get(category, {})
-            for class_name, class_data in classes.items():
-                module = class_data.get("module", "Other")
-                modules[module].append(class_name)
+        with self._lock:
+            if self._modules_cache is not None:
+                return self._modules_cache
 
-        # Sort class names within each module
-        for module in modules:
-            modules[module].sort()
+            toc_stamp = self._get_toc_stamp()
+            modules_path = self.get_modules_path()
+            if toc_stamp is not None and modules_path.exists():
+                try:
+                    with open(modules_path, "rb") as f:
+                        cached = json_loads(f.read())
+                    if isinstance(cached, dict) and cached.get("toc") == toc_stamp:
+                        self._modules_cache = cached["modules"]
+                        return self._modules_cache
+                except (ValueError, IOError, KeyError):
+                    pass
 
-        return dict(modules)
+            toc = self.load_toc()
+            if not toc:
+                return {}
+
+            # Collect (module, class) pairs from both Class and Native categories
+            # (Native includes custom modules), then sort once and group by module
+            pairs = [
+                (class_data.get("module", "Other"), class_name)
+                for category in ("Class", "Native")
+                for class_name, class_data in toc.get(category, {}).items()
+            ]
+            pairs.sort()
+
+            self._modules_cache = {
+                module: [class_name for _, class_name in group]
+                for module, group in itertools.groupby(pairs, key=operator.itemgetter(0))
+            }
+            return self._modules_cache
 
     def get_summary(self) -> str:
         """
@@ -365,13 +855,22 @@ class CacheManager:
         Returns:
             Summary text (~2KB) with category counts and module list
         """
-        toc = self.load_toc()
-        if not toc:
-            return self._get_placeholder_summary()
-
+        if self._summary_cache is not None:
+            return self._summary_cache
+
+        with self._lock:
+            if self._summary_cache is None:
+                toc = self.load_toc()
+                if not toc:
+                    return self._get_placeholder_summary()
+                self._summary_cache = self._generate_summary(toc)
+            return self._summary_cache
+
+    def _generate_summary(self, toc: dict) -> str:
+        """Generate the summary text from TOC JSON."""
         lines = [
             "# Unreal Python API Summary",
-            f"> Generated: {datetime.now().strftime('%Y-%m-%d')}",
+            f"> Generated: {self._get_generated_date()}",
             "",
             "## Categories",
             "",
@@ -454,15 +953,14 @@ class CacheManager:
             "",
         ]
 
-        # Get classes from both Class and Native categories
-        all_classes = {}
-        all_classes.update(toc.get("Class", {}))
-        all_classes.update(toc.get("Native", {}))
+        # Look classes up in Native first, then Class, instead of merging both categories per call
+        classes = toc.get("Class", {})
+        natives = toc.get("Native", {})
 
         for class_name in modules[module_name]:
-            class_data = all_classes.get(class_name, {})
-            func_count = len(class_data.get("func", []))
-            prop_count = len(class_data.get("prop", []))
+            class_data = natives[class_name] if class_name in natives else classes.get(class_name, {})
+            func_count = len(class_data.get("func", _EMPTY))
+            prop_count = len(class_data.get("prop", _EMPTY))
             lines.append(f"- [{class_name}](/class/{class_name}): {func_count} methods, {prop_count} properties")
 
         return "\n".join(lines)
@@ -485,9 +983,9 @@ class CacheManager:
             "",
         ]
 
-        for enum_name in sorted(enums.keys()):
-            enum_data = enums.get(enum_name, {})
-            const_count = len(enum_data.get("const", []))
+        for enum_name in sorted(enums):
+            enum_data = enums[enum_name]
+            const_count = len(enum_data.get("const", _EMPTY))
             lines.append(f"- {enum_name}: {const_count} values")
 
         return "\n".join(lines)
@@ -510,10 +1008,10 @@ class CacheManager:
             "",
         ]
 
-        for struct_name in sorted(structs.keys()):
-            struct_data = structs.get(struct_name, {})
-            prop_count = len(struct_data.get("prop", []))
-            func_count = len(struct_data.get("func", []))
+        for struct_name in sorted(structs):
+            struct_data = structs[struct_name]
+            prop_count = len(struct_data.get("prop", _EMPTY))
+            func_count = len(struct_data.get("func", _EMPTY))
             if func_count > 0:
                 lines.append(f"- {struct_name}: {prop_count} properties, {func_count} methods")
             else:
@@ -539,20 +1037,48 @@ class CacheManager:
             "",
         ]
 
-        for delegate_name in sorted(delegates.keys()):
+        for delegate_name in sorted(delegates):
             lines.append(f"- {delegate_name}")
 
         return "\n".join(lines)
 
-    def list_modules(self) -> list[str]:
+    def get_modules_listing(self, top: int | None = None) -> str | None:
         """
-        List all available modules sorted by class count.
+        Get the module list with class counts, as shown by the list_modules tool.
+
+        Args:
+            top: If set, only list this many modules with the most classes
 
         Returns:
-            List of module names
+            Listing text sorted by class count, or None if there are no modules
         """
-        modules = self.get_modules()
-        return sorted(modules.keys(), key=lambda m: -len(modules[m]))
+        if top is not None:
+            modules = self.get_modules()
+            if not modules:
+                return None
+            largest = heapq.nlargest(top, modules.items(), key=lambda x: len(x[1]))
+            return self._format_modules_listing(len(modules), largest)
+
+        if self._modules_listing_cache is not None:
+            return self._modules_listing_cache
+
+        with self._lock:
+            if self._modules_listing_cache is None:
+                modules = self.get_modules()
+                if not modules:
+                    return None
+                sorted_modules = sorted(modules.items(), key=lambda x: -len(x[1]))
+                self._modules_listing_cache = self._format_modules_listing(len(modules), sorted_modules)
+            return self._modules_listing_cache
+
+    def _format_modules_listing(self, total: int, sorted_modules: list[tuple[str, list[str]]]) -> str:
+        """Format (module, classes) pairs, already sorted by class count, as the module listing."""
+        header = f"Available modules ({total} total):"
+        if len(sorted_modules) < total:
+            header = f"Available modules ({total} total, showing top {len(sorted_modules)}):"
+        lines = [header, ""]
+        lines.extend(f"  {module}: {len(classes)} classes" for module, classes in sorted_modules)
+        return "\n".join(lines)
 
     def get_class_overview(self, class_name: str, include_doc: bool = False) -> dict | None:
         """
@@ -572,6 +1098,61 @@ class CacheManager:
         if not toc:
             return None
 
+        overview = self._build_class_overview(toc, class_name)
+        if overview is None:
+            return None
+
+        # Optionally fetch basic info (doc, bases) from Unreal
+        if include_doc and self._unreal_connection is not None:
+            basic_info = self._unreal_connection.fetch_class_basic_info(class_name)
+            if basic_info:
+                overview["doc"] = basic_info.get("doc", "")
+                overview["bases"] = basic_info.get("bases", [])
+
+        return overview
+
+    def get_classes_overview(self, class_names: list[str], include_doc: bool = False) -> list[dict]:
+        """
+        Get class overviews for multiple classes at once (batch operation).
+
+        With include_doc=True, doc and bases for all classes are fetched from
+        Unreal in round-trips of up to CLASS_INFO_BATCH_SIZE classes each.
+
+        Args:
+            class_names: The class names
+            include_doc: If True, fetch doc and bases from Unreal (default: False)
+
+        Returns:
+            List of overview dicts (skips classes not found in the TOC)
+        """
+        toc = self.load_toc()
+        if not toc:
+            return []
+
+        overviews = []
+        for class_name in class_names:
+            overview = self._build_class_overview(toc, class_name)
+            if overview is not None:
+                overviews.append(overview)
+
+        if include_doc and overviews and self._unreal_connection is not None:
+            for start in range(0, len(overviews), CLASS_INFO_BATCH_SIZE):
+                batch = overviews[start:start + CLASS_INFO_BATCH_SIZE]
+                basic_infos = self._unreal_connection.fetch_classes_basic_info(
+                    [overview["name"] for overview in batch]
+                )
+                if not basic_infos:
+                    continue
+                for overview in batch:
+                    basic_info = basic_infos.get(overview["name"])
+                    if basic_info:
+                        overview["doc"] = basic_info.get("doc", "")
+                        overview["bases"] = basic_info.get("bases", [])
+
+        return overviews
+
+    def _build_class_overview(self, toc: dict, class_name: str) -> dict | None:
+        """Build a class overview from TOC data, or None if the class is not in the TOC."""
         # Find class in TOC (check all categories)
         class_data = None
         for category in ["Class", "Struct", "Enum", "Native"]:
@@ -582,8 +1163,7 @@ class CacheManager:
         if not class_data:
             return None
 
-        # Build overview from TOC data
-        overview = {
+        return {
             "name": class_name,
             "module": class_data.get("module"),
             "methods": class_data.get("func", []),
@@ -592,23 +1172,45 @@ class CacheManager:
             "constants": class_data.get("const", []),
         }
 
-        # Optionally fetch basic info (doc, bases) from Unreal
-        if include_doc and self._unreal_connection is not None:
-            basic_info_json = self._unreal_connection.fetch_class_basic_info(class_name)
-            if basic_info_json:
-                try:
-                    basic_info = json.loads(basic_info_json)
-                    overview["doc"] = basic_info.get("doc", "")
-                    overview["bases"] = basic_info.get("bases", [])
-                except json.JSONDecodeError:
-                    pass
+    def _get_member_db(self) -> sqlite3.Connection:
+        """Open (once) the member documentation cache database; the caller holds self._member_db_lock."""
+        if self._member_cache_db is None:
+            db = sqlite3.connect(self.get_member_cache_path(), check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS members"
+                " (class TEXT, member TEXT, json BLOB, PRIMARY KEY (class, member))"
+            )
+            self._member_cache_db = db
+        return self._member_cache_db
+
+    def _load_cached_members(self, class_name: str, member_names: list[str]) -> dict[str, dict]:
+        """Look up cached member docs, returning a mapping of member name to info."""
+        placeholders = ",".join("?" * len(member_names))
+        try:
+            with self._member_db_lock:
+                rows = self._get_member_db().execute(
+                    f"SELECT member, json FROM members WHERE class = ? AND member IN ({placeholders})",
+                    (class_name, *member_names),
+                ).fetchall()
+            return {member: json_loads(data) for member, data in rows}
+        except (sqlite3.Error, ValueError):
+            return {}
 
-        return overview
+    def _store_members(self, class_name: str, members_info: list[dict]) -> None:
+        """Write fetched member docs to the member cache database."""
+        rows = [(class_name, info["name"], json_dumps(info)) for info in members_info]
+        try:
+            with self._member_db_lock, self._get_member_db() as db:
+                db.executemany("INSERT OR REPLACE INTO members (class, member, json) VALUES (?, ?, ?)", rows)
+        except sqlite3.Error:
+            pass
 
     def get_member_info(self, class_name: str, member_name: str) -> dict | None:
         """
         Get detailed info for a specific member (method, property, or constant).
 
+        Checks the member cache database first, then fetches from Unreal.
+
         Args:
             class_name: The class name
             member_name: The member name
@@ -616,15 +1218,17 @@ class CacheManager:
         Returns:
             Dict with member details (type, doc, signature, etc.)
         """
+        cached = self._load_cached_members(class_name, [member_name])
+        if member_name in cached:
+            return cached[member_name]
+
         if self._unreal_connection is None:
             return None
 
-        member_json = self._unreal_connection.fetch_member_info(class_name, member_name)
-        if member_json:
-            try:
-                return json.loads(member_json)
-            except json.JSONDecodeError:
-                pass
+        member_info = self._unreal_connection.fetch_member_info(class_name, member_name)
+        if member_info:
+            self._store_members(class_name, [member_info])
+            return member_info
 
         return None
 
@@ -632,16 +1236,28 @@ class CacheManager:
         """
         Get detailed info for multiple members at once (batch operation).
 
+        Cached members are read from the member cache database; the rest
+        are fetched from Unreal in a single round-trip.
+
         Args:
             class_name: The class name
             member_names: List of member names to fetch
 
         Returns:
-            List of member info dicts (skips members that couldn't be fetched)
+            List of member info dicts, one per distinct name (skips members that couldn't be fetched)
         """
-        results = []
-        for member_name in member_names:
-            member_info = self.get_member_info(class_name, member_name)
-            if member_info:
-                results.append(member_info)
-        return results
+        if not member_names:
+            return []
+
+        # Each member is looked up, fetched and returned once, in first-requested order
+        member_names = list(dict.fromkeys(member_names))
+        found = self._load_cached_members(class_name, member_names)
+        missing = [name for name in member_names if name not in found]
+
+        if missing and self._unreal_connection is not None:
+            fetched = self._unreal_connection.fetch_members_info(class_name, missing)
+            if fetched:
+                self._store_members(class_name, fetched)
+                found.update((info["name"], info) for info in fetched)
+
+        return [found[name] for name in member_names if name in found]
@@ -25,11 +25,10 @@ def refresh_cache() -> None:
 
     try:
         print("Connecting to Unreal Editor...")
-        conn = UnrealConnection()
-
-        print("Refreshing API cache...")
-        cache = CacheManager()
-        cache.refresh_from_unreal(conn)
+        with UnrealConnection() as conn:
+            print("Refreshing API cache...")
+            cache = CacheManager()
+            cache.refresh_from_unreal(conn)
 
         print("✓ Cache refreshed successfully")
         sys.exit(0)
@@ -0,0 +1,212 @@
+"""
+Build the API table of contents inside the Unreal Editor's Python.
+
+Compiled once into the documentation helpers module (see doc_helpers.py),
+whose build_toc() runs it with CUSTOM_MODULES (module names from
+UNREAL_PYTHON_CUSTOM_MODULES) and PAYLOAD_MARKER defined.
+
+Prints the TOC right after PAYLOAD_MARKER as a record count line followed
+by one tab-separated record per symbol:
+
+    category, name, module, func, cls_func, prop, const
+
+where each member list is comma-separated (empty when there are none).
+"""
+
+import warnings
+import inspect
+import types
+import unreal
+
+def get_module_name(cls):
+    """Extract module name from static_class().get_path_name()."""
+    if hasattr(cls, 'static_class'):
+        try:
+            sc = cls.static_class()
+            if sc:
+                path = sc.get_path_name()
+                # /Script/ModuleName.ClassName -> ModuleName
+                if path.startswith('/Script/'):
+                    parts = path[8:].split('.')
+                    if len(parts) >= 1:
+                        return parts[0]
+        except:
+            pass
+    return None
+
+class UnrealClassRepresentation:
+    def __init__(self, name, cls, is_custom_module=False):
+        self.name = name
+        self.cls = cls
+        self.module = get_module_name(cls)
+        self.methods = []
+        self.classmethods = []
+        self.properties = []
+        self.constants = []
+        self.is_custom_module = is_custom_module
+        self.load_members()
+
+    def load_members(self):
+        # Buckets for the common member types of unreal classes, matching the checks below
+        buckets_by_type = {
+            types.MethodDescriptorType: self.methods,
+            types.WrapperDescriptorType: self.methods,
+            types.GetSetDescriptorType: self.properties,
+            types.MemberDescriptorType: self.properties,
+            types.BuiltinFunctionType: self.classmethods,
+            int: self.constants,
+        }
+        # Custom module classes are bucketed by their raw __dict__ slot, before any getattr
+        custom_buckets_by_type = {
+            property: self.properties,
+            types.FunctionType: self.methods,
+            classmethod: self.classmethods,
+            staticmethod: self.classmethods,
+            int: self.constants,
+            float: self.constants,
+            str: self.constants,
+            bool: self.constants,
+        }
+        enum_base = unreal.EnumBase
+        struct_base = unreal.StructBase
+
+        # Only the class's own names (inherited methods / properties are ignored), looked up via getattr
+        for name, slot in sorted(vars(self.cls).items()):
+            if name.startswith("_"):
+                continue
+            if self.is_custom_module:
+                bucket = custom_buckets_by_type.get(type(slot))
+                if bucket is not None:
+                    bucket.append(name)
+                    continue
+            try:
+                member = getattr(self.cls, name)
+            except AttributeError:
+                continue
+
+            if self.is_custom_module:
+                # Generic detection logic for custom modules
+                if isinstance(member, property):
+                    self.properties.append(name)
+                elif callable(member):
+                    # Check if it's a class method or static method
+                    if isinstance(inspect.getattr_static(self.cls, name), (classmethod, staticmethod)):
+                        self.classmethods.append(name)
+                    else:
+                        self.methods.append(name)
+                elif isinstance(member, (int, float, str, bool)):
+                    self.constants.append(name)
+                # If it's another type, treat as property
+                elif not inspect.ismodule(member) and not inspect.isclass(member):
+                    self.properties.append(name)
+            else:
+                # Original logic for unreal module classes
+                bucket = buckets_by_type.get(type(member))
+                if bucket is not None:
+                    bucket.append(name)
+                elif inspect.ismethoddescriptor(member):
+                    self.methods.append(name)
+                elif inspect.isgetsetdescriptor(member):
+                    self.properties.append(name)
+                elif issubclass(type(member), enum_base):
+                    self.properties.append(name)
+                elif issubclass(type(member), struct_base):
+                    self.properties.append(name)
+                elif inspect.isbuiltin(member):
+                    self.classmethods.append(name)
+                elif inspect.ismemberdescriptor(member):
+                    self.properties.append(name)
+                elif isinstance(member, int):
+                    self.constants.append(name)
+
+    def get_record(self, category):
+        return "\t".join((
+            category,
+            self.name,
+            self.module or "",
+            ",".join(self.methods),
+            ",".join(self.classmethods),
+            ",".join(self.properties),
+            ",".join(self.constants),
+        ))
+
+class TableOfContents:
+    def __init__(self):
+        self.classes = []
+        self.enums = []
+        self.struct = []
+        self.delegates = []
+        self.natives = []
+        self.functions = []
+
+    def load(self):
+        enum_base = unreal.EnumBase
+        struct_base = unreal.StructBase
+        delegate_bases = (unreal.DelegateBase, unreal.MulticastDelegateBase)
+        object_base = unreal.Object
+
+        for object_name, obj in sorted(vars(unreal).items()):
+            if inspect.isclass(obj):
+                classobject = UnrealClassRepresentation(object_name, obj)
+                # Strict superclasses, collected once instead of walking the MRO for each check
+                ancestors = set(obj.__mro__[1:])
+                if enum_base in ancestors:
+                    self.enums.append(classobject)
+                elif struct_base in ancestors:
+                    self.struct.append(classobject)
+                elif not ancestors.isdisjoint(delegate_bases) and obj not in delegate_bases:
+                    self.delegates.append(classobject)
+                elif object_base in ancestors:
+                    self.classes.append(classobject)
+                else:
+                    self.natives.append(classobject)
+            elif inspect.isfunction(obj) or isinstance(obj, types.BuiltinFunctionType):
+                self.functions.append((object_name, obj))
+
+    def get_records(self):
+        records = []
+        for category, entries in (
+            ("Native", self.natives),
+            ("Struct", self.struct),
+            ("Class", self.classes),
+            ("Enum", self.enums),
+            ("Delegate", self.delegates),
+        ):
+            records.extend(x.get_record(category) for x in entries)
+        records.extend(f"Function\t{name}\t\t\t\t\t" for name, func in self.functions)
+        return records
+
+toc = TableOfContents()
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    toc.load()
+
+# Process custom modules if specified
+custom_modules = CUSTOM_MODULES
+if custom_modules:
+    import sys
+    import importlib
+    for module_name in custom_modules:
+        try:
+            # Try to import the module if it's not already loaded
+            if module_name not in sys.modules:
+                importlib.import_module(module_name)
+
+            custom_module = sys.modules[module_name]
+            for object_name, obj in sorted(vars(custom_module).items()):
+                if object_name.startswith("_"):
+                    continue
+                if inspect.isclass(obj):
+                    # Check if class is from this custom module
+                    if hasattr(obj, '__module__') and obj.__module__.startswith(module_name):
+                        classobject = UnrealClassRepresentation(object_name, obj, is_custom_module=True)
+                        # Override module to use custom module name
+                        classobject.module = module_name
+                        # Categorize as Native class (since not from unreal module)
+                        toc.natives.append(classobject)
+        except ImportError:
+            # Skip modules that cannot be imported
+            pass
+
+records = toc.get_records()
+print(PAYLOAD_MARKER + str(len(records)) + "\n" + "\n".join(records))
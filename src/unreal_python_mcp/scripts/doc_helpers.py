@@ -0,0 +1,228 @@
+"""
+Documentation helpers installed once into the Unreal Editor's Python.
+
+UnrealConnection runs this file inside a module registered in sys.modules,
+then each fetch only sends a one-line call such as class_doc("Actor").
+Every helper prints its result as JSON ("null" when nothing was found),
+right after PAYLOAD_MARKER, which the installer defines before running this
+(along with TOC_CODE, the compiled scripts/build_toc.py).
+"""
+
+import inspect
+import json
+import types
+
+import unreal
+
+
+# Slot types that class-level getattr returns unchanged, so the raw __dict__ value can be used as is
+_UNBOUND_TYPES = frozenset((
+    property,
+    types.FunctionType,
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+    types.GetSetDescriptorType,
+    types.MemberDescriptorType,
+))
+
+# C-level callables; inspect.signature can only read these from __text_signature__
+_BUILTIN_TYPES = (
+    types.BuiltinFunctionType,
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+    types.MethodWrapperType,
+    types.ClassMethodDescriptorType,
+)
+
+# Signature strings by callable; inherited methods are the same object in every subclass
+_signatures = {}
+
+# Cleaned docstrings by raw docstring; constants of one type all share that type's docstring
+_clean_docs = {}
+
+
+def _emit(value):
+    print(PAYLOAD_MARKER + json.dumps(value))
+
+
+def _get_bases(obj):
+    return [b.__name__ for b in getattr(obj, '__bases__', []) if hasattr(b, '__name__')]
+
+
+def _getdoc(obj):
+    try:
+        doc = obj.__doc__
+    except AttributeError:
+        return ""
+    if not isinstance(doc, str):
+        # No docstring of its own; inspect.getdoc looks for an inherited one
+        return inspect.getdoc(obj) or ""
+
+    cleaned = _clean_docs.get(doc)
+    if cleaned is None:
+        cleaned = _clean_docs[doc] = inspect.cleandoc(doc)
+    return cleaned
+
+
+def _signature(member):
+    try:
+        return _signatures[member]
+    except (KeyError, TypeError):
+        pass
+
+    if (isinstance(member, _BUILTIN_TYPES)
+            and getattr(member, '__text_signature__', None) is None
+            and getattr(member, '__signature__', None) is None):
+        # Most Unreal bindings have no text signature, which inspect.signature rejects anyway
+        sig = "()"
+    else:
+        try:
+            sig = str(inspect.signature(member))
+        except (ValueError, TypeError):
+            sig = "()"
+
+    try:
+        _signatures[member] = sig
+    except TypeError:
+        pass
+    return sig
+
+
+def _describe_member(member_name, member):
+    result = {"name": member_name}
+    result["doc"] = _getdoc(member)
+
+    if isinstance(member, property):
+        result["type"] = "property"
+    elif callable(member):
+        result["type"] = "method"
+        result["signature"] = _signature(member)
+    else:
+        result["type"] = "constant"
+        result["value"] = repr(member)[:100]
+
+    return result
+
+
+def _public_members(obj):
+    """Yield (name, member) for the public attributes of obj, sorted by name like dir()."""
+    mro = getattr(obj, '__mro__', None) if inspect.isclass(obj) else None
+    if mro is None:
+        for name in dir(obj):
+            if name.startswith('_'):
+                continue
+            try:
+                yield name, getattr(obj, name)
+            except AttributeError:
+                continue
+        return
+
+    # Walk the class dicts directly; the first class in the MRO defining a name wins
+    slots = {}
+    for klass in mro:
+        for name, value in vars(klass).items():
+            if name not in slots and not name.startswith('_'):
+                slots[name] = value
+
+    for name in sorted(slots):
+        value = slots[name]
+        if type(value) in _UNBOUND_TYPES or not hasattr(type(value), '__get__'):
+            yield name, value
+            continue
+        # Other descriptors (classmethod, staticmethod, ...) need binding
+        try:
+            yield name, getattr(obj, name)
+        except AttributeError:
+            continue
+
+
+def _basic_info(class_name, obj):
+    return {
+        "name": class_name,
+        "doc": _getdoc(obj),
+        "bases": _get_bases(obj),
+    }
+
+
+def class_basic_info(class_name):
+    obj = getattr(unreal, class_name, None)
+    _emit(_basic_info(class_name, obj) if obj is not None else None)
+
+
+def classes_basic_info(class_names):
+    results = {}
+    for class_name in class_names:
+        obj = getattr(unreal, class_name, None)
+        if obj is not None:
+            results[class_name] = _basic_info(class_name, obj)
+    _emit(results)
+
+
+def member_info(class_name, member_name):
+    obj = getattr(unreal, class_name, None)
+    member = getattr(obj, member_name, None) if obj is not None else None
+    _emit(_describe_member(member_name, member) if member is not None else None)
+
+
+def members_info(class_name, member_names):
+    obj = getattr(unreal, class_name, None)
+    if obj is None:
+        _emit(None)
+        return
+
+    results = []
+    for member_name in member_names:
+        member = getattr(obj, member_name, None)
+        if member is not None:
+            results.append(_describe_member(member_name, member))
+    _emit(results)
+
+
+def _class_doc(class_name, obj):
+    doc = {
+        "name": class_name,
+        "doc": _getdoc(obj),
+        "bases": _get_bases(obj),
+        "is_class": inspect.isclass(obj),
+        "members": {
+            "methods": [],
+            "properties": [],
+            "constants": []
+        }
+    }
+
+    for name, member in _public_members(obj):
+        member_info = {"name": name, "doc": _getdoc(member)}
+
+        if isinstance(member, property):
+            doc["members"]["properties"].append(member_info)
+        elif callable(member):
+            member_info["signature"] = _signature(member)
+            doc["members"]["methods"].append(member_info)
+        else:
+            member_info["value"] = repr(member)[:100]
+            doc["members"]["constants"].append(member_info)
+
+    return doc
+
+
+def class_doc(class_name):
+    obj = getattr(unreal, class_name, None)
+    _emit(_class_doc(class_name, obj) if obj is not None else None)
+
+
+def class_docs(class_names):
+    results = {}
+    for class_name in class_names:
+        obj = getattr(unreal, class_name, None)
+        if obj is not None:
+            results[class_name] = _class_doc(class_name, obj)
+    _emit(results)
+
+
+def build_toc(custom_modules):
+    exec(TOC_CODE, {
+        "__name__": "__main__",
+        "CUSTOM_MODULES": custom_modules,
+        "PAYLOAD_MARKER": PAYLOAD_MARKER,
+    })
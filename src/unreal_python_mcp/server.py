@@ -3,19 +3,21 @@ MCP Server for Unreal Python API
 
 Provides:
 - Resources: llms-index (API documentation index), module/category indexes
-- Tools: search_unreal_api, get_class_overview, get_member_info, get_members_info, exec_unreal_python
+- Tools: search_unreal_api, get_class_overview, get_classes_overview, get_class_docs, get_member_info, get_members_info, exec_unreal_python
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import re
 from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 
 from unreal_python_mcp import __version__
-from unreal_python_mcp.cache import CacheManager
+from unreal_python_mcp.cache import CacheManager, json_dumps
 from unreal_python_mcp.unreal_connection import UnrealConnection
 
 # Initialize MCP server
@@ -25,6 +27,19 @@ mcp = FastMCP("Unreal Python API")
 _cache_manager: CacheManager | None = None
 _unreal_connection: UnrealConnection | None = None
 
+# Tools and resources are async and run their blocking work via asyncio.to_thread: remote
+# commands wait on Unreal, and index lookups can wait on the cache lock while a TOC is being
+# saved or the indexes are warmed, and neither may stall the event loop.
+# Remote commands themselves run one at a time (the protocol has no request IDs).
+
+# Tool responses are compact JSON unless UNREAL_PYTHON_PRETTY_JSON is set (for debugging)
+PRETTY_JSON = bool(os.environ.get("UNREAL_PYTHON_PRETTY_JSON"))
+
+
+def to_json(obj) -> str:
+    """Serialize a tool/resource response, compact unless PRETTY_JSON is enabled."""
+    return json_dumps(obj, indent=PRETTY_JSON).decode("utf-8")
+
 
 def get_cache_manager() -> CacheManager:
     """Get or create the cache manager instance."""
@@ -49,7 +64,7 @@ def get_unreal_connection() -> UnrealConnection:
 # ============================================================================
 
 @mcp.resource("unreal-python://index/summary")
-def get_index_summary() -> str:
+async def get_index_summary() -> str:
     """
     Lightweight summary of the Unreal Python API (~2KB).
 
@@ -57,11 +72,11 @@ def get_index_summary() -> str:
     It shows available modules and categories, then load specific indexes as needed.
     """
     cache = get_cache_manager()
-    return cache.get_summary()
+    return await asyncio.to_thread(cache.get_summary)
 
 
 @mcp.resource("unreal-python://index/module/{name}")
-def get_module_index(name: str) -> str:
+async def get_module_index(name: str) -> str:
     """
     Get classes for a specific Unreal module.
 
@@ -75,28 +90,28 @@ def get_module_index(name: str) -> str:
     - Niagara: Particle system classes
     """
     cache = get_cache_manager()
-    return cache.get_module_index(name)
+    return await asyncio.to_thread(cache.get_module_index, name)
 
 
 @mcp.resource("unreal-python://index/enums")
-def get_enums_index() -> str:
+async def get_enums_index() -> str:
     """Get the index of all Unreal Python enums."""
     cache = get_cache_manager()
-    return cache.get_enums_index()
+    return await asyncio.to_thread(cache.get_enums_index)
 
 
 @mcp.resource("unreal-python://index/structs")
-def get_structs_index() -> str:
+async def get_structs_index() -> str:
     """Get the index of all Unreal Python structs (Vector, Transform, etc.)."""
     cache = get_cache_manager()
-    return cache.get_structs_index()
+    return await asyncio.to_thread(cache.get_structs_index)
 
 
 @mcp.resource("unreal-python://index/delegates")
-def get_delegates_index() -> str:
+async def get_delegates_index() -> str:
     """Get the index of all Unreal Python delegates."""
     cache = get_cache_manager()
-    return cache.get_delegates_index()
+    return await asyncio.to_thread(cache.get_delegates_index)
 
 
 # ============================================================================
@@ -104,7 +119,7 @@ def get_delegates_index() -> str:
 # ============================================================================
 
 @mcp.resource("unreal-python://llms-index")
-def get_llms_index() -> str:
+async def get_llms_index() -> str:
     """
     [DEPRECATED] Complete Unreal Python API index.
 
@@ -112,11 +127,11 @@ def get_llms_index() -> str:
     Use unreal-python://index/summary instead, then load specific modules.
     """
     cache = get_cache_manager()
-    return cache.get_llms_index()
+    return await asyncio.to_thread(cache.get_llms_index)
 
 
 @mcp.resource("unreal-python://class/{name}")
-def get_class_resource(name: str) -> str:
+async def get_class_resource(name: str) -> str:
     """
     Get detailed documentation for a specific Unreal Python class.
 
@@ -124,9 +139,14 @@ def get_class_resource(name: str) -> str:
         name: The class name (e.g., "Actor", "EditorAssetLibrary")
     """
     cache = get_cache_manager()
-    doc = cache.get_class_doc(name)
-    if doc:
-        return json.dumps(doc, indent=2)
+    if PRETTY_JSON:
+        doc = await asyncio.to_thread(cache.get_class_doc, name)
+        if doc:
+            return to_json(doc)
+    else:
+        raw = await asyncio.to_thread(cache.get_class_doc_raw, name)
+        if raw:
+            return raw
     return json.dumps({"error": f"Class '{name}' not found"})
 
 
@@ -135,25 +155,26 @@ def get_class_resource(name: str) -> str:
 # ============================================================================
 
 @mcp.tool()
-def search_unreal_api(query: str) -> str:
+async def search_unreal_api(query: str) -> str:
     """
     Search Unreal Python API by class or function name.
 
     Returns matching entries from the API index. Use this to find
     the correct class/function name before getting detailed documentation.
+    An exact (case-sensitive) name returns only that entry.
 
     Args:
         query: Search query (supports partial matching and regex)
     """
     cache = get_cache_manager()
-    results = cache.search_api(query)
+    results = await asyncio.to_thread(cache.search_api, query)
     if not results:
         return f"No results found for '{query}'"
     return "\n".join(results)
 
 
 @mcp.tool()
-def get_class_overview(class_name: str, include_doc: bool = False) -> str:
+async def get_class_overview(class_name: str, include_doc: bool = False) -> str:
     """
     Get class overview with member name lists only (very lightweight).
 
@@ -170,14 +191,56 @@ def get_class_overview(class_name: str, include_doc: bool = False) -> str:
         include_doc: If True, also fetch class docstring and bases (default: False)
     """
     cache = get_cache_manager()
-    overview = cache.get_class_overview(class_name, include_doc=include_doc)
+    overview = await asyncio.to_thread(cache.get_class_overview, class_name, include_doc=include_doc)
     if overview:
-        return json.dumps(overview, indent=2)
+        return to_json(overview)
     return json.dumps({"error": f"Class '{class_name}' not found. Use search_unreal_api to find the correct name."})
 
 
 @mcp.tool()
-def get_member_info(class_name: str, member_name: str) -> str:
+async def get_classes_overview(class_names: list[str], include_doc: bool = False) -> str:
+    """
+    Get class overviews for multiple classes at once (batch operation).
+
+    More efficient than calling get_class_overview multiple times, especially
+    with include_doc=True: docstrings and bases for all classes are fetched
+    from Unreal together.
+
+    Args:
+        class_names: The exact class names (e.g., ["Actor", "StaticMeshActor"])
+        include_doc: If True, also fetch class docstrings and bases (default: False)
+    """
+    cache = get_cache_manager()
+    overviews = await asyncio.to_thread(cache.get_classes_overview, class_names, include_doc=include_doc)
+    if overviews:
+        return to_json(overviews)
+    return json.dumps({"error": "No classes found. Use search_unreal_api to find the correct names."})
+
+
+@mcp.tool()
+async def get_class_docs(class_names: list[str]) -> str:
+    """
+    Get detailed documentation for multiple classes at once (batch operation).
+
+    Returns the same documentation as the unreal-python://class/{name} resource,
+    keyed by class name. Uncached classes are fetched from Unreal together
+    instead of one round-trip per class.
+
+    WARNING: Full docs of large classes like Actor are 100KB+ each.
+    Prefer get_classes_overview unless docstrings of every member are needed.
+
+    Args:
+        class_names: The exact class names (e.g., ["Actor", "StaticMeshActor"])
+    """
+    cache = get_cache_manager()
+    docs = await asyncio.to_thread(cache.get_class_docs, class_names)
+    if docs:
+        return to_json(docs)
+    return json.dumps({"error": "No classes found. Use search_unreal_api to find the correct names."})
+
+
+@mcp.tool()
+async def get_member_info(class_name: str, member_name: str) -> str:
     """
     Get detailed documentation for a specific member of a class.
 
@@ -189,14 +252,14 @@ def get_member_info(class_name: str, member_name: str) -> str:
         member_name: The member name (e.g., "get_actor_location")
     """
     cache = get_cache_manager()
-    member_info = cache.get_member_info(class_name, member_name)
+    member_info = await asyncio.to_thread(cache.get_member_info, class_name, member_name)
     if member_info:
-        return json.dumps(member_info, indent=2)
+        return to_json(member_info)
     return json.dumps({"error": f"Member '{member_name}' not found in class '{class_name}'."})
 
 
 @mcp.tool()
-def get_members_info(class_name: str, member_names: list[str]) -> str:
+async def get_members_info(class_name: str, member_names: list[str]) -> str:
     """
     Get detailed documentation for multiple members at once (batch operation).
 
@@ -208,14 +271,14 @@ def get_members_info(class_name: str, member_names: list[str]) -> str:
         member_names: List of member names (e.g., ["get_actor_location", "set_actor_location"])
     """
     cache = get_cache_manager()
-    members_info = cache.get_members_info(class_name, member_names)
+    members_info = await asyncio.to_thread(cache.get_members_info, class_name, member_names)
     if members_info:
-        return json.dumps(members_info, indent=2)
+        return to_json(members_info)
     return json.dumps({"error": f"No members found for class '{class_name}'."})
 
 
 @mcp.tool()
-def exec_unreal_python(code: str) -> str:
+async def exec_unreal_python(code: str) -> str:
     """
     Execute Python code in the running Unreal Editor.
 
@@ -226,42 +289,40 @@ def exec_unreal_python(code: str) -> str:
         code: Python code to execute in Unreal Editor
     """
     conn = get_unreal_connection()
-    return conn.execute(code)
+    return await asyncio.to_thread(conn.execute, code)
 
 
 @mcp.tool()
-def list_unreal_instances() -> str:
+async def list_unreal_instances() -> str:
     """
     List all running Unreal Editor instances with Remote Execution enabled.
 
     Use this to check if Unreal Editor is available for code execution.
     """
     conn = get_unreal_connection()
-    return conn.list_instances()
+    return await asyncio.to_thread(conn.list_instances)
 
 
 @mcp.tool()
-def list_modules() -> str:
+async def list_modules(top: int | None = None) -> str:
     """
     List all available Unreal modules with class counts.
 
     Use this to discover what modules are available, then use
     unreal-python://index/module/{name} resource to get classes for that module.
+
+    Args:
+        top: If set, only list this many modules with the most classes (default: all)
     """
     cache = get_cache_manager()
-    modules = cache.get_modules()
-    if not modules:
+    listing = await asyncio.to_thread(cache.get_modules_listing, top=top)
+    if listing is None:
         return "Cache not initialized. Use refresh_api_cache tool first."
-
-    sorted_modules = sorted(modules.items(), key=lambda x: -len(x[1]))
-    lines = [f"Available modules ({len(modules)} total):", ""]
-    for module, classes in sorted_modules:
-        lines.append(f"  {module}: {len(classes)} classes")
-    return "\n".join(lines)
+    return listing
 
 
 @mcp.tool()
-def refresh_api_cache() -> str:
+async def refresh_api_cache() -> str:
     """
     Refresh the Unreal Python API documentation cache.
 
@@ -271,7 +332,7 @@ def refresh_api_cache() -> str:
     cache = get_cache_manager()
     conn = get_unreal_connection()
     try:
-        cache.refresh_from_unreal(conn)
+        await asyncio.to_thread(cache.refresh_from_unreal, conn)
         return "Cache refreshed successfully"
     except Exception as e:
         return f"Failed to refresh cache: {e}"
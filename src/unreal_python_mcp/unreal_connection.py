@@ -9,22 +9,292 @@ Handles:
 
 from __future__ import annotations
 
+import functools
+import json
 import os
+import select
+import selectors
 import socket
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any
 
 from upyrc import upyre
 
+from unreal_python_mcp.cache import json_loads
+
 
 # Python scripts to execute in Unreal
 SCRIPT_DIR = Path(__file__).parent / "scripts"
 
 
+# Discovery stops once no pong has arrived for this long (seconds) after the last one
+DISCOVERY_IDLE_TIMEOUT = 0.2
+
+# Receive buffer size (bytes) requested for the discovery socket
+DISCOVERY_RECV_BUFFER_SIZE = 1 << 20
+
+# Whether the discovery socket is kept open between discoveries. It shares the multicast
+# port with the socket upyre opens for each command connection, which (like ours) only sets
+# SO_REUSEADDR; that is enough to share a UDP port on Linux and Windows, but the BSDs
+# (including macOS) would refuse the second bind while the first socket is open.
+KEEP_DISCOVERY_SOCKET = sys.platform.startswith("linux") or sys.platform == "win32"
+
+# Minimum time (seconds) allowed for building the TOC, which walks every type in the editor
+TOC_TIMEOUT = 120.0
+
+# Minimum time (seconds) allowed for a batched class doc or basic info fetch
+BATCH_TIMEOUT = 30.0
+
+# Maximum number of classes whose basic info is kept in memory (least recently used are dropped first)
+CLASS_INFO_CACHE_SIZE = 4096
+
+# Module the documentation helpers are installed as inside Unreal's Python
+HELPERS_MODULE = "_unreal_python_mcp_helpers"
+
+# Printed by a helper call when the helpers are missing (or outdated) in the editor
+_HELPERS_MISSING = "__unreal_python_mcp_helpers_missing__"
+
+# Printed (with the helpers version) by the install script once the helpers are in place
+_HELPERS_INSTALLED = "__unreal_python_mcp_helpers_installed__"
+
+# Printed by the editor-side scripts right before their JSON result, so log output
+# (which may contain braces of its own) is never mistaken for the payload
+PAYLOAD_MARKER = "<<<UPYMCP_JSON>>>"
+
+# TOC categories in the order scripts/build_toc.py emits them
+TOC_CATEGORIES = ("Native", "Struct", "Class", "Enum", "Delegate", "Function")
+
+# TOC keys of the comma-separated member list fields in a TOC record, in record order
+_TOC_MEMBER_KEYS = ("func", "cls_func", "prop", "const")
+
+# Prefix for each output entry type in execute() results (other types are shown as is)
+_OUTPUT_PREFIXES = {"Warning": "Warning: ", "Error": "Error: "}
+
+# Script for one helper call; the helpers module already holds its imports, so none are sent
+_HELPER_CALL = (
+    "helpers = __import__('sys').modules.get({module!r})\n"
+    "if getattr(helpers, 'VERSION', None) == {version!r}:\n"
+    "    helpers.{call}\n"
+    "else:\n"
+    "    print({missing!r})\n"
+)
+
+
+@functools.cache
+def _read_script(name: str) -> str:
+    """Read a script from SCRIPT_DIR to send to Unreal (read once per process)."""
+    return (SCRIPT_DIR / name).read_text(encoding="utf-8")
+
+
+@functools.cache
+def _helpers_install_code() -> tuple[str, str]:
+    """
+    Build the script that installs scripts/doc_helpers.py as HELPERS_MODULE in Unreal.
+
+    scripts/build_toc.py is compiled into the module as TOC_CODE at the same
+    time, so fetching the TOC only sends a build_toc(...) call.
+
+    The script prints _HELPERS_INSTALLED and the version as its last step,
+    so a successful install can be told apart from one that failed midway.
+
+    Returns:
+        The install script, and the helpers version it stamps on the module
+    """
+    source = _read_script("doc_helpers.py")
+    toc_source = _read_script("build_toc.py")
+    # The marker is part of the helpers' output format, so it versions them too
+    version = f"{zlib.crc32((PAYLOAD_MARKER + source + toc_source).encode('utf-8')):08x}"
+    return f'''
+import sys
+import types
+
+module = types.ModuleType({HELPERS_MODULE!r})
+module.PAYLOAD_MARKER = {PAYLOAD_MARKER!r}
+module.TOC_CODE = compile({toc_source!r}, "build_toc.py", "exec")
+exec(compile({source!r}, {HELPERS_MODULE!r}, "exec"), module.__dict__)
+module.VERSION = {version!r}
+sys.modules[{HELPERS_MODULE!r}] = module
+print({_HELPERS_INSTALLED!r}, module.VERSION)
+''', version
+
+
+def _is_connection_alive(conn: upyre.PythonRemoteConnection) -> bool:
+    """Check without blocking whether Unreal still has the command socket open."""
+    sock = conn.remote_command_connection.cmd_connection
+    timeout = sock.gettimeout()
+    sock.settimeout(0)
+    try:
+        # An orderly close reads as b""; an idle, open socket has nothing to read
+        return sock.recv(1, socket.MSG_PEEK) != b""
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.settimeout(timeout)
+
+
+def _recv_pending(sock: socket.socket, bufsize: int) -> list[bytes]:
+    """Read every datagram already queued on a non-blocking socket (each holds one complete message)."""
+    packets = []
+    while True:
+        try:
+            packet, _ = sock.recvfrom(bufsize)
+        except BlockingIOError:
+            return packets
+        packets.append(packet)
+
+
+def _parse_payload(output: str) -> Any:
+    """
+    Parse the JSON value an editor-side script printed after PAYLOAD_MARKER.
+
+    The payload is compact JSON on a single line, so it is sliced out and
+    parsed once with json_loads (orjson when installed).
+
+    Returns:
+        The parsed value, or None if the output contains no valid payload
+    """
+    start = output.find(PAYLOAD_MARKER)
+    if start < 0:
+        return None
+    start += len(PAYLOAD_MARKER)
+    end = output.find("\n", start)
+    try:
+        return json_loads(output[start:end] if end >= 0 else output[start:])
+    except ValueError:
+        return None
+
+
+def _parse_toc_payload(output: str) -> dict | None:
+    """
+    Parse the TOC records scripts/build_toc.py printed after PAYLOAD_MARKER.
+
+    The payload is a record count line followed by that many tab-separated
+    records, so anything printed afterwards is ignored.
+
+    Returns:
+        The TOC dict, or None if the output contains no valid payload
+    """
+    start = output.find(PAYLOAD_MARKER)
+    if start < 0:
+        return None
+    count_line, _, body = output[start + len(PAYLOAD_MARKER):].partition("\n")
+    try:
+        count = int(count_line)
+    except ValueError:
+        return None
+    records = body.split("\n", count)[:count] if count else []
+    if len(records) < count:
+        return None
+
+    toc: dict[str, dict] = {category: {} for category in TOC_CATEGORIES}
+    try:
+        for record in records:
+            category, name, module, *member_lists = record.split("\t")
+            data = {"module": module} if module else {}
+            for key, members in zip(_TOC_MEMBER_KEYS, member_lists, strict=True):
+                if members:
+                    # The same member names recur across many classes; keep one copy of each
+                    data[key] = list(map(sys.intern, members.split(",")))
+            toc[category][name] = data
+    except (KeyError, ValueError):
+        return None
+    return toc
+
+
 class UnrealConnection:
     """Manages connection to Unreal Editor via upyrc."""
 
     def __init__(self, timeout: float = 5.0):
         self.timeout = timeout
+        # Shared remote execution settings (multicast group, local node ID, command address)
+        self._config = upyre.RemoteExecutionConfig()
+        # Command connection reused across execute calls (opened lazily)
+        self._conn: upyre.PythonRemoteConnection | None = None
+        # The remote execution protocol has no request IDs, so commands on the shared connection are serialized
+        self._lock = threading.Lock()
+        # Whether the documentation helpers were installed over the current connection
+        self._helpers_installed = False
+        # Basic info (doc, bases) of recently fetched classes, until invalidate_cache()
+        self._class_info_cache: OrderedDict[str, dict] = OrderedDict()
+        # Multicast socket reused across discoveries (opened lazily), and the lock serializing them
+        self._mcastsock: socket.socket | None = None
+        self._discovery_lock = threading.Lock()
+        # Guards _class_info_cache, which callers on other threads read while a command runs
+        self._cache_lock = threading.Lock()
+
+    def __enter__(self) -> UnrealConnection:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the command connection to Unreal Editor and the discovery socket, if open."""
+        with self._lock:
+            self._drop_connection()
+        with self._discovery_lock:
+            self._close_discovery_socket()
+
+    def invalidate_cache(self) -> None:
+        """Forget memoized class info, e.g. before refreshing the API cache."""
+        with self._cache_lock:
+            self._class_info_cache.clear()
+
+    def _cached_class_info(self, class_name: str) -> dict | None:
+        """Return a class's memoized basic info (marking it recently used), or None."""
+        with self._cache_lock:
+            info = self._class_info_cache.get(class_name)
+            if info is not None:
+                self._class_info_cache.move_to_end(class_name)
+            return info
+
+    def _remember_class_info(self, class_name: str, info: dict) -> None:
+        """Memoize a class's basic info, evicting the least recently used beyond the limit."""
+        with self._cache_lock:
+            self._class_info_cache[class_name] = info
+            self._class_info_cache.move_to_end(class_name)
+            while len(self._class_info_cache) > CLASS_INFO_CACHE_SIZE:
+                self._class_info_cache.popitem(last=False)
+
+    def _drop_connection(self) -> None:
+        """Close and forget the cached command connection."""
+        conn, self._conn = self._conn, None
+        # A new connection may reach a restarted (or different) editor
+        self._helpers_installed = False
+        if conn is not None:
+            try:
+                conn.close_connection()
+            except Exception:
+                pass
+
+    def _ensure_connected(self) -> upyre.PythonRemoteConnection:
+        """Return the open command connection, reconnecting if it is missing or was closed by Unreal."""
+        if self._conn is not None and not _is_connection_alive(self._conn):
+            self._drop_connection()
+
+        if self._conn is None:
+            # upyre binds the multicast port for the connection, so release ours first
+            with self._discovery_lock:
+                self._close_discovery_socket()
+            # The previous command port may have been taken since it was picked, so pick a fresh one
+            self._config.COMMAND_ADDRESS = upyre.get_command_address()
+            conn = upyre.PythonRemoteConnection(self._config)
+            try:
+                conn.open_connection()
+            except Exception:
+                conn.mcastsock.close()
+                raise
+            # Commands are small request/response exchanges; don't let Nagle hold them back
+            conn.remote_command_connection.cmd_connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._conn = conn
+        return self._conn
 
     def list_instances(self) -> str:
         """
@@ -52,56 +322,111 @@ class UnrealConnection:
             lines.append(f"  - {inst['project_name']} (Unreal {inst['engine_version']})")
         return "\n".join(lines)
 
-    def _discover_instances(self, timeout: float = 1.0) -> list[dict]:
-        """Discover all running Unreal Editor instances."""
-        config = upyre.RemoteExecutionConfig()
-        instances = []
+    def _get_discovery_socket(self) -> socket.socket:
+        """Return the multicast discovery socket, joining the group on first use; the caller holds self._discovery_lock."""
+        if self._mcastsock is not None:
+            return self._mcastsock
 
+        config = self._config
         mcastsock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-        mcastsock.settimeout(timeout)
-        mcastsock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, config.IP_MULTICAST_TTL)
-        mcastsock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
-        mcastsock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        mcastsock.bind((config.MULTICAST_BIND_ADDRESS, config.MULTICAST_GROUP[1]))
-        membership_request = socket.inet_aton(config.MULTICAST_GROUP[0]) + socket.inet_aton(config.MULTICAST_BIND_ADDRESS)
-        mcastsock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership_request)
-
         try:
-            ping_message = upyre.PingMessage(config)
-            ping_message.send(mcastsock)
-
-            seen_nodes = set()
-            for result in ping_message.raw_receive(mcastsock):
-                if result.get("type") == "pong":
-                    node_id = result.get("source", "")
-                    if node_id and node_id not in seen_nodes:
-                        seen_nodes.add(node_id)
-                        data = result.get("data", {})
-                        instances.append({
-                            "node_id": node_id,
-                            "project_name": data.get("project_name", "Unknown"),
-                            "engine_version": data.get("engine_version", "Unknown"),
-                        })
-        finally:
+            mcastsock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, config.IP_MULTICAST_TTL)
+            mcastsock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+            mcastsock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # Room for every pong of a burst, so none are dropped before they are read
+            mcastsock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, DISCOVERY_RECV_BUFFER_SIZE)
+            mcastsock.bind((config.MULTICAST_BIND_ADDRESS, config.MULTICAST_GROUP[1]))
+            membership_request = socket.inet_aton(config.MULTICAST_GROUP[0]) + socket.inet_aton(config.MULTICAST_BIND_ADDRESS)
+            mcastsock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership_request)
+            # select() does the waiting; reads only drain what is already queued
+            mcastsock.setblocking(False)
+        except OSError:
             mcastsock.close()
+            raise
 
-        return instances
+        self._mcastsock = mcastsock
+        return mcastsock
 
-    def execute(self, code: str) -> str:
+    def _close_discovery_socket(self) -> None:
+        """Close the multicast discovery socket (leaving the group); the caller holds self._discovery_lock."""
+        mcastsock, self._mcastsock = self._mcastsock, None
+        if mcastsock is not None:
+            mcastsock.close()
+
+    def _discover_instances(self, timeout: float = 1.0) -> list[dict]:
+        """
+        Discover all running Unreal Editor instances.
+
+        Waits at most timeout seconds, and returns early once the pongs stop
+        arriving for DISCOVERY_IDLE_TIMEOUT. The multicast socket is kept
+        open between calls where KEEP_DISCOVERY_SOCKET allows it, until a
+        command connection is opened.
+        """
+        config = self._config
+        # Instances by node ID; insertion order is discovery order
+        instances: dict[str, dict] = {}
+
+        with self._discovery_lock:
+            mcastsock = self._get_discovery_socket()
+            try:
+                # Pongs that arrived after the previous discovery ended are stale
+                _recv_pending(mcastsock, config.BUFFER_SIZE)
+
+                ping_message = upyre.PingMessage(config)
+                ping_message.send(mcastsock)
+
+                deadline = time.monotonic() + timeout
+                stop_at = deadline
+                while True:
+                    wait = stop_at - time.monotonic()
+                    if wait <= 0 or not select.select([mcastsock], [], [], wait)[0]:
+                        break
+
+                    for packet in _recv_pending(mcastsock, config.BUFFER_SIZE):
+                        try:
+                            result = json.loads(packet)
+                        except ValueError:
+                            continue
+
+                        if result.get("type") == "pong":
+                            stop_at = min(deadline, time.monotonic() + DISCOVERY_IDLE_TIMEOUT)
+                            node_id = result.get("source", "")
+                            if node_id and node_id not in instances:
+                                data = result.get("data", {})
+                                instances[node_id] = {
+                                    "node_id": node_id,
+                                    "project_name": data.get("project_name", "Unknown"),
+                                    "engine_version": data.get("engine_version", "Unknown"),
+                                }
+            except OSError:
+                # Start from a fresh socket next time
+                self._close_discovery_socket()
+                raise
+            if not KEEP_DISCOVERY_SOCKET:
+                self._close_discovery_socket()
+
+        return list(instances.values())
+
+    def execute(self, code: str, timeout: float | None = None) -> str:
         """
         Execute Python code in Unreal Editor.
 
         Args:
             code: Python code to execute
+            timeout: Seconds to wait for the result (defaults to self.timeout)
 
         Returns:
             Execution result or error message
         """
-        config = upyre.RemoteExecutionConfig()
+        with self._lock:
+            return self._execute_locked(code, timeout)
 
+    def _execute_locked(self, code: str, timeout: float | None = None) -> str:
+        """Execute code on the shared command connection; the caller holds self._lock."""
+        if timeout is None:
+            timeout = self.timeout
         try:
-            conn = upyre.PythonRemoteConnection(config)
-            conn.open_connection()
+            conn = self._ensure_connected()
         except upyre.ConnectionError:
             return (
                 "Error: Could not connect to Unreal Editor.\n"
@@ -114,26 +439,13 @@ class UnrealConnection:
             return f"Error connecting to Unreal Editor: {e}"
 
         try:
-            result = conn.execute_python_command(
-                code,
-                exec_type=upyre.ExecTypes.EXECUTE_FILE,
-                timeout=self.timeout,
-                raise_exc=False,
-            )
-
-            output_lines = []
+            result = self._run_command(conn, code, timeout)
 
             # Collect output
-            if result.output:
-                for entry in result.output:
-                    output_type = entry.get("type", "Info")
-                    output_text = entry.get("output", "")
-                    if output_type == "Warning":
-                        output_lines.append(f"Warning: {output_text}")
-                    elif output_type == "Error":
-                        output_lines.append(f"Error: {output_text}")
-                    else:
-                        output_lines.append(output_text)
+            output_lines = [
+                _OUTPUT_PREFIXES.get(entry.get("type"), "") + entry.get("output", "")
+                for entry in result.output or ()
+            ]
 
             if result.success:
                 result_value = result.data.get("result", "None")
@@ -147,16 +459,111 @@ class UnrealConnection:
                 return "\n".join(output_lines)
 
         except socket.timeout:
-            return f"Error: Execution timed out after {self.timeout} seconds."
+            # A late reply would be read as the next command's result, so start over
+            self._drop_connection()
+            return f"Error: Execution timed out after {timeout} seconds."
         except Exception as e:
+            self._drop_connection()
             return f"Error during execution: {e}"
-        finally:
-            try:
-                conn.close_connection()
-            except Exception:
-                pass
 
-    def fetch_toc(self) -> str | None:
+    def _run_command(self, conn: upyre.PythonRemoteConnection, code: str, timeout: float) -> upyre.PythonCommandResult:
+        """
+        Send code to Unreal as a file command and wait at most timeout seconds in total for its result.
+
+        This replaces upyre's execute_python_command, whose receive loop restarts its
+        socket timeout on every chunk, spins on a connection closed by Unreal, and
+        re-parses the whole buffer after each chunk. The message is built through
+        upyre's command connection internals (_raw_data, to_data), which is why the
+        upyrc version is pinned in pyproject.toml.
+
+        Raises:
+            socket.timeout: If the result did not arrive in time
+            ConnectionError: If Unreal closed the connection
+        """
+        command = conn.remote_command_connection
+        command._raw_data["data"] = {
+            "command": code,
+            "unattended": True,
+            "exec_mode": upyre.ExecTypes.EXECUTE_FILE,
+        }
+        sock = command.cmd_connection
+        if hasattr(socket, "TCP_QUICKACK"):
+            # Linux clears quick-ack mode again after a while, so it is re-armed for every command
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        sock.sendall(command.to_data())
+
+        deadline = time.monotonic() + timeout
+        chunks = []
+        with selectors.DefaultSelector() as selector:
+            selector.register(sock, selectors.EVENT_READ)
+            while True:
+                wait = deadline - time.monotonic()
+                if wait <= 0 or not selector.select(wait):
+                    raise socket.timeout(f"no result within {timeout} seconds")
+
+                chunk = sock.recv(self._config.BUFFER_SIZE)
+                if not chunk:
+                    raise ConnectionError("Unreal Editor closed the connection")
+                chunks.append(chunk)
+                # A message is one JSON object; only a chunk ending it can complete one
+                if not chunk.rstrip().endswith(b"}"):
+                    continue
+                try:
+                    message = json.loads(b"".join(chunks))
+                except ValueError:
+                    continue
+                chunks.clear()
+
+                # Skip echoes of our own command message
+                if message.get("type") != command.TYPE:
+                    return upyre.PythonCommandResult(message)
+
+    def _call_helper(self, call: str, timeout: float | None = None) -> str:
+        """
+        Run a documentation helper call in Unreal Editor, installing the helpers first if needed.
+
+        Args:
+            call: A call to a scripts/doc_helpers.py function, with arguments as Python literals
+            timeout: Seconds to wait for the call's result (defaults to self.timeout)
+
+        Returns:
+            Execution result or error message
+        """
+        _, version = _helpers_install_code()
+        code = _HELPER_CALL.format(module=HELPERS_MODULE, version=version, call=call, missing=_HELPERS_MISSING)
+        # Held across install and call, so no other command can run in between
+        with self._lock:
+            if not self._helpers_installed:
+                error = self._install_helpers_locked()
+                if error is not None:
+                    return error
+
+            output = self._execute_locked(code, timeout)
+            if _HELPERS_MISSING in output:
+                # Unreal lost the helpers (e.g. the Python environment was reset); install them again
+                error = self._install_helpers_locked()
+                if error is not None:
+                    return error
+                output = self._execute_locked(code, timeout)
+            return output
+
+    def _install_helpers_locked(self) -> str | None:
+        """
+        Install the documentation helpers in Unreal Editor; the caller holds self._lock.
+
+        Returns:
+            None once Unreal confirmed the install, otherwise an error message
+        """
+        install_code, version = _helpers_install_code()
+        output = self._execute_locked(install_code)
+        self._helpers_installed = f"{_HELPERS_INSTALLED} {version}" in output
+        if self._helpers_installed:
+            return None
+        if output.startswith("Error"):
+            return output
+        return f"Error installing documentation helpers: {output}"
+
+    def fetch_toc(self) -> dict | None:
         """
         Fetch the API TOC (Table of Contents) from Unreal Editor.
 
@@ -164,7 +571,7 @@ class UnrealConnection:
         UNREAL_PYTHON_CUSTOM_MODULES environment variable.
 
         Returns:
-            JSON string of the TOC, or None if failed
+            The TOC dict, or None if failed
         """
         # Get custom modules from environment variable
         custom_modules_env = os.environ.get("UNREAL_PYTHON_CUSTOM_MODULES", "")
@@ -173,234 +580,78 @@ class UnrealConnection:
         # build_toc.py の get_table_of_content_json() を実行
         # オリジナルの vscode-unreal-python/python/documentation/build_toc.py と同じロジック
         # Module 情報を追加して返す
-        code = '''
-import warnings
-import inspect
-import types
-import json
-import unreal
-
-def issubclass_strict(cls, class_or_tuple):
-    if not issubclass(cls, class_or_tuple):
-        return False
-    if isinstance(class_or_tuple, tuple):
-        return cls not in class_or_tuple
-    return cls is not class_or_tuple
-
-def get_module_name(cls):
-    """Extract module name from static_class().get_path_name()."""
-    if hasattr(cls, 'static_class'):
-        try:
-            sc = cls.static_class()
-            if sc:
-                path = sc.get_path_name()
-                # /Script/ModuleName.ClassName -> ModuleName
-                if path.startswith('/Script/'):
-                    parts = path[8:].split('.')
-                    if len(parts) >= 1:
-                        return parts[0]
-        except:
-            pass
-    return None
-
-class UnrealClassRepresentation:
-    def __init__(self, name, cls, is_custom_module=False):
-        self.name = name
-        self.cls = cls
-        self.module = get_module_name(cls)
-        self.methods = []
-        self.classmethods = []
-        self.properties = []
-        self.constants = []
-        self.is_custom_module = is_custom_module
-        self.load_members()
-
-    def load_members(self):
-        for name, member in inspect.getmembers(self.cls):
-            if name.startswith("_"):
-                continue
-            # ignore inherited methods / properties
-            if name not in self.cls.__dict__:
-                continue
-
-            if self.is_custom_module:
-                # Generic detection logic for custom modules
-                if isinstance(member, property):
-                    self.properties.append(name)
-                elif callable(member):
-                    # Check if it's a class method or static method
-                    if isinstance(inspect.getattr_static(self.cls, name), (classmethod, staticmethod)):
-                        self.classmethods.append(name)
-                    else:
-                        self.methods.append(name)
-                elif isinstance(member, (int, float, str, bool)):
-                    self.constants.append(name)
-                # If it's another type, treat as property
-                elif not inspect.ismodule(member) and not inspect.isclass(member):
-                    self.properties.append(name)
-            else:
-                # Original logic for unreal module classes
-                if inspect.ismethoddescriptor(member):
-                    self.methods.append(name)
-                elif inspect.isgetsetdescriptor(member):
-                    self.properties.append(name)
-                elif issubclass(type(member), unreal.EnumBase):
-                    self.properties.append(name)
-                elif issubclass(type(member), unreal.StructBase):
-                    self.properties.append(name)
-                elif inspect.isbuiltin(member):
-                    self.classmethods.append(name)
-                elif inspect.ismemberdescriptor(member):
-                    self.properties.append(name)
-                elif isinstance(member, int):
-                    self.constants.append(name)
-
-    def get_dict(self):
-        data = {}
-        if self.module:
-            data["module"] = self.module
-        for object_type, object_list in (("func", self.methods),
-                                         ("cls_func", self.classmethods),
-                                         ("prop", self.properties),
-                                         ("const", self.constants)):
-            if object_list:
-                data[object_type] = object_list
-        return data
-
-class TableOfContents:
-    def __init__(self):
-        self.classes = []
-        self.enums = []
-        self.struct = []
-        self.delegates = []
-        self.natives = []
-        self.functions = []
-
-    def load(self):
-        for object_name, obj in inspect.getmembers(unreal):
-            if inspect.isclass(obj):
-                classobject = UnrealClassRepresentation(object_name, obj)
-                if issubclass_strict(obj, unreal.EnumBase):
-                    self.enums.append(classobject)
-                elif issubclass_strict(obj, unreal.StructBase):
-                    self.struct.append(classobject)
-                elif issubclass_strict(obj, (unreal.DelegateBase, unreal.MulticastDelegateBase)):
-                    self.delegates.append(classobject)
-                elif issubclass_strict(obj, unreal.Object):
-                    self.classes.append(classobject)
-                else:
-                    self.natives.append(classobject)
-            elif inspect.isfunction(obj) or isinstance(obj, types.BuiltinFunctionType):
-                self.functions.append((object_name, obj))
-
-    def get_dict(self):
-        data = {}
-        for name, object_list in (("Native", self.natives),
-                                  ("Struct", self.struct),
-                                  ("Class", self.classes),
-                                  ("Enum", self.enums),
-                                  ("Delegate", self.delegates)):
-            data[name] = {x.name: x.get_dict() for x in object_list}
-        data["Function"] = {name: {} for name, func in self.functions}
-        return data
-
-toc = TableOfContents()
-with warnings.catch_warnings():
-    warnings.simplefilter("ignore")
-    toc.load()
-
-# Process custom modules if specified
-custom_modules = __CUSTOM_MODULES_PLACEHOLDER__
-if custom_modules:
-    import sys
-    import importlib
-    for module_name in custom_modules:
-        try:
-            # Try to import the module if it's not already loaded
-            if module_name not in sys.modules:
-                importlib.import_module(module_name)
+        # (build_toc.py は helpers のインストール時に一度だけコンパイル済み)
+        output = self._call_helper(f"build_toc({custom_modules!r})", max(self.timeout, TOC_TIMEOUT))
 
-            custom_module = sys.modules[module_name]
-            for object_name, obj in inspect.getmembers(custom_module):
-                if object_name.startswith("_"):
-                    continue
-                if inspect.isclass(obj):
-                    # Check if class is from this custom module
-                    if hasattr(obj, '__module__') and obj.__module__.startswith(module_name):
-                        classobject = UnrealClassRepresentation(object_name, obj, is_custom_module=True)
-                        # Override module to use custom module name
-                        classobject.module = module_name
-                        # Categorize as Native class (since not from unreal module)
-                        toc.natives.append(classobject)
-        except ImportError:
-            # Skip modules that cannot be imported
-            pass
-
-result = json.dumps(toc.get_dict(), separators=(',', ':'))
-print(result)
-'''
-        # Replace placeholder with actual custom modules list
-        code = code.replace("__CUSTOM_MODULES_PLACEHOLDER__", repr(custom_modules))
-        output = self.execute(code)
-
-        # 出力から JSON を抽出
+        # 出力から TOC レコードを抽出
         if output and not output.startswith("Error"):
-            # 最初の { から最後の } までを抽出
-            try:
-                start = output.index("{")
-                end = output.rindex("}") + 1
-                json_str = output[start:end]
-                # 有効な JSON かチェック
-                import json
-                json.loads(json_str)
-                return json_str
-            except (ValueError, json.JSONDecodeError):
-                pass
+            return _parse_toc_payload(output)
 
         return None
 
-    def fetch_class_basic_info(self, class_name: str) -> str | None:
+    def fetch_class_basic_info(self, class_name: str) -> dict | None:
         """
         Fetch only basic info (doc and bases) for a class - lightweight query.
 
+        Results are memoized until invalidate_cache() is called.
+
         Args:
             class_name: The class name to fetch basic info for
 
         Returns:
-            JSON string with name, doc, and bases only, or None if failed
+            Dict with name, doc, and bases only, or None if failed
         """
-        code = f'''
-import inspect
-import json
-import unreal
-
-obj = getattr(unreal, "{class_name}", None)
-if obj is not None:
-    result = {{
-        "name": "{class_name}",
-        "doc": inspect.getdoc(obj) or "",
-        "bases": [b.__name__ for b in getattr(obj, '__bases__', []) if hasattr(b, '__name__')]
-    }}
-    print(json.dumps(result))
-else:
-    print("null")
-'''
-        output = self.execute(code)
+        info = self._cached_class_info(class_name)
+        if info is not None:
+            return info
+
+        output = self._call_helper(f"class_basic_info({class_name!r})")
 
         if output and not output.startswith("Error"):
-            try:
-                start = output.index("{")
-                end = output.rindex("}") + 1
-                json_str = output[start:end]
-                import json
-                json.loads(json_str)
-                return json_str
-            except (ValueError, json.JSONDecodeError):
-                pass
+            info = _parse_payload(output)
+            if info is not None:
+                self._remember_class_info(class_name, info)
+            return info
 
         return None
 
-    def fetch_member_info(self, class_name: str, member_name: str) -> str | None:
+    def fetch_classes_basic_info(self, class_names: list[str]) -> dict[str, dict] | None:
+        """
+        Fetch basic info (doc and bases) for multiple classes in a single round-trip.
+
+        Classes whose info is already memoized are not fetched again.
+
+        Args:
+            class_names: The class names to fetch basic info for
+
+        Returns:
+            Dict mapping each class that was found to its name, doc, and
+            bases, or None if failed
+        """
+        results = {}
+        missing = []
+        for class_name in class_names:
+            info = self._cached_class_info(class_name)
+            if info is not None:
+                results[class_name] = info
+            else:
+                missing.append(class_name)
+        if not missing:
+            return results
+
+        output = self._call_helper(f"classes_basic_info({missing!r})", max(self.timeout, BATCH_TIMEOUT))
+
+        if output and not output.startswith("Error"):
+            fetched = _parse_payload(output)
+            if fetched is not None:
+                for class_name, info in fetched.items():
+                    self._remember_class_info(class_name, info)
+                results.update(fetched)
+                return results
+
+        return results or None
+
+    def fetch_member_info(self, class_name: str, member_name: str) -> dict | None:
         """
         Fetch detailed info for a specific member of a class.
 
@@ -409,54 +660,34 @@ else:
             member_name: The member name (method, property, or constant)
 
         Returns:
-            JSON string with member details, or None if failed
+            Dict with member details, or None if failed
         """
-        code = f'''
-import inspect
-import json
-import unreal
-
-obj = getattr(unreal, "{class_name}", None)
-if obj is not None:
-    member = getattr(obj, "{member_name}", None)
-    if member is not None:
-        result = {{"name": "{member_name}"}}
-        result["doc"] = inspect.getdoc(member) or ""
-
-        if isinstance(member, property):
-            result["type"] = "property"
-        elif callable(member):
-            result["type"] = "method"
-            try:
-                result["signature"] = str(inspect.signature(member))
-            except (ValueError, TypeError):
-                result["signature"] = "()"
-        else:
-            result["type"] = "constant"
-            result["value"] = repr(member)[:100]
-
-        print(json.dumps(result))
-    else:
-        print("null")
-else:
-    print("null")
-'''
-        output = self.execute(code)
+        output = self._call_helper(f"member_info({class_name!r}, {member_name!r})")
 
         if output and not output.startswith("Error"):
-            try:
-                start = output.index("{")
-                end = output.rindex("}") + 1
-                json_str = output[start:end]
-                import json
-                json.loads(json_str)
-                return json_str
-            except (ValueError, json.JSONDecodeError):
-                pass
+            return _parse_payload(output)
+
+        return None
+
+    def fetch_members_info(self, class_name: str, member_names: list[str]) -> list[dict] | None:
+        """
+        Fetch detailed info for multiple members of a class in a single round-trip.
+
+        Args:
+            class_name: The class name
+            member_names: The member names (methods, properties, or constants)
+
+        Returns:
+            List of member detail dicts for the members that were found, or None if failed
+        """
+        output = self._call_helper(f"members_info({class_name!r}, {member_names!r})")
+
+        if output and not output.startswith("Error"):
+            return _parse_payload(output)
 
         return None
 
-    def fetch_class_doc(self, class_name: str) -> str | None:
+    def fetch_class_doc(self, class_name: str) -> dict | None:
         """
         Fetch detailed documentation for a specific class.
 
@@ -464,68 +695,28 @@ else:
             class_name: The class name to fetch documentation for
 
         Returns:
-            JSON string of the class documentation, or None if failed
+            Dict of the class documentation, or None if failed
         """
-        code = f'''
-import inspect
-import json
-import unreal
+        output = self._call_helper(f"class_doc({class_name!r})")
+
+        if output and not output.startswith("Error"):
+            return _parse_payload(output)
 
-def get_class_doc(class_name):
-    obj = getattr(unreal, class_name, None)
-    if obj is None:
         return None
 
-    doc = {{
-        "name": class_name,
-        "doc": inspect.getdoc(obj) or "",
-        "bases": [b.__name__ for b in getattr(obj, '__bases__', []) if hasattr(b, '__name__')],
-        "is_class": inspect.isclass(obj),
-        "members": {{
-            "methods": [],
-            "properties": [],
-            "constants": []
-        }}
-    }}
-
-    for name, member in inspect.getmembers(obj):
-        if name.startswith('_'):
-            continue
-
-        member_info = {{"name": name, "doc": inspect.getdoc(member) or ""}}
-
-        if isinstance(member, property):
-            doc["members"]["properties"].append(member_info)
-        elif callable(member):
-            try:
-                sig = str(inspect.signature(member))
-            except (ValueError, TypeError):
-                sig = "()"
-            member_info["signature"] = sig
-            doc["members"]["methods"].append(member_info)
-        else:
-            member_info["value"] = repr(member)[:100]
-            doc["members"]["constants"].append(member_info)
-
-    return doc
-
-result = get_class_doc("{class_name}")
-if result:
-    print(json.dumps(result))
-else:
-    print("null")
-'''
-        output = self.execute(code)
+    def fetch_class_docs(self, class_names: list[str]) -> dict[str, dict] | None:
+        """
+        Fetch detailed documentation for multiple classes in a single round-trip.
+
+        Args:
+            class_names: The class names to fetch documentation for
+
+        Returns:
+            Dict mapping each class that was found to its documentation, or None if failed
+        """
+        output = self._call_helper(f"class_docs({class_names!r})", max(self.timeout, BATCH_TIMEOUT))
 
         if output and not output.startswith("Error"):
-            try:
-                start = output.index("{")
-                end = output.rindex("}") + 1
-                json_str = output[start:end]
-                import json
-                json.loads(json_str)
-                return json_str
-            except (ValueError, json.JSONDecodeError):
-                pass
+            return _parse_payload(output)
 
         return None
@@ -0,0 +1,117 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from unreal_python_mcp.cache import CacheManager, _atomic_write
+
+
+class AtomicWriteTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+
+    def test_concurrent_writers_do_not_collide(self):
+        path = self.dir / "toc.json"
+        payloads = [bytes([ord("a") + i]) * 4096 for i in range(8)]
+        errors = []
+
+        def write(data):
+            try:
+                for _ in range(20):
+                    _atomic_write(path, data)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(data,)) for data in payloads]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertIn(path.read_bytes(), payloads)
+        self.assertEqual(list(self.dir.iterdir()), [path])
+
+    def test_failed_write_removes_temp_file(self):
+        path = self.dir / "toc.json"
+        path.write_bytes(b"old")
+        with mock.patch("os.replace", side_effect=OSError("boom")), self.assertRaises(OSError):
+            _atomic_write(path, b"new")
+
+        self.assertEqual(path.read_bytes(), b"old")
+        self.assertEqual(list(self.dir.iterdir()), [path])
+
+
+class ClassDocPathTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache_dir = Path(self._tmp.name) / "cache"
+        self.cache = CacheManager(cache_dir=self.cache_dir)
+
+    def test_rejects_names_escaping_classes_dir(self):
+        for name in ("../toc", "..", "a/b", "a\\b", "/etc/passwd", "", "Actor.json"):
+            with self.subTest(name=name):
+                with self.assertRaises(ValueError):
+                    self.cache.get_class_doc_path(name)
+                with self.assertRaises(ValueError):
+                    self.cache.get_compressed_class_doc_path(name)
+
+    def test_accepts_identifiers(self):
+        path = self.cache.get_class_doc_path("StaticMeshActor")
+        self.assertEqual(path, self.cache_dir / "classes" / "StaticMeshActor.json")
+
+    def test_traversal_never_reads_or_rewrites_outside_files(self):
+        # A legacy (pretty-printed) doc would be migrated, i.e. rewritten and unlinked, if it were read
+        outside = self.cache_dir / "secret.json"
+        self.cache_dir.mkdir(parents=True)
+        outside.write_bytes(b'{\n  "name": "secret"\n}')
+
+        self.assertIsNone(self.cache.get_class_doc("../secret"))
+        self.assertIsNone(self.cache.get_class_doc_raw("../secret"))
+        self.assertEqual(self.cache.get_class_docs(["../secret"]), {})
+        with self.assertRaises(ValueError):
+            self.cache.save_class_doc("../secret", {"name": "secret"})
+
+        self.assertEqual(outside.read_bytes(), b'{\n  "name": "secret"\n}')
+        self.assertEqual(list(self.cache_dir.iterdir()), [outside])
+
+
+class ModulesCacheTest(unittest.TestCase):
+    TOC = {"Class": {"Actor": {"module": "Engine"}, "Widget": {"module": "UMG"}}, "Native": {}}
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache_dir = Path(self._tmp.name)
+        cache = CacheManager(cache_dir=self.cache_dir)
+        with mock.patch("threading.Thread"):
+            cache.save_toc(self.TOC)
+
+    def test_modules_json_reused_with_its_toc(self):
+        cache = CacheManager(cache_dir=self.cache_dir)
+        with mock.patch.object(CacheManager, "load_toc", side_effect=AssertionError("TOC should not be parsed")):
+            self.assertEqual(cache.get_modules(), {"Engine": ["Actor"], "UMG": ["Widget"]})
+
+    def test_modules_json_ignored_without_toc(self):
+        CacheManager(cache_dir=self.cache_dir).get_toc_path().unlink()
+        self.assertEqual(CacheManager(cache_dir=self.cache_dir).get_modules(), {})
+
+    def test_modules_json_ignored_for_another_toc(self):
+        cache = CacheManager(cache_dir=self.cache_dir)
+        cache.get_toc_path().write_text('{"Class": {"Actor": {"module": "CoreUObject"}}}', encoding="utf-8")
+        self.assertEqual(CacheManager(cache_dir=self.cache_dir).get_modules(), {"CoreUObject": ["Actor"]})
+
+    def test_refresh_without_toc_drops_modules_json(self):
+        cache = CacheManager(cache_dir=self.cache_dir)
+        conn = mock.Mock()
+        conn.fetch_toc.return_value = None
+        cache.refresh_from_unreal(conn)
+        self.assertFalse(cache.get_modules_path().exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
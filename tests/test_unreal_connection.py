@@ -0,0 +1,228 @@
+import json
+import socket
+import threading
+import time
+import types
+import unittest
+from unittest import mock
+
+from upyrc import upyre
+
+from unreal_python_mcp import unreal_connection
+from unreal_python_mcp.unreal_connection import BATCH_TIMEOUT, TOC_TIMEOUT, UnrealConnection
+
+
+def _message(message_type: str, data: dict) -> bytes:
+    return json.dumps({"type": message_type, "source": "unreal", "dest": "local", "data": data}).encode()
+
+
+class RunCommandTest(unittest.TestCase):
+    """_run_command against a real TCP connection standing in for Unreal's command socket."""
+
+    def setUp(self):
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            client = socket.create_connection(server.getsockname())
+            self.unreal, _ = server.accept()
+        self.addCleanup(client.close)
+        self.addCleanup(self.unreal.close)
+
+        command = upyre.PythonRemoteCommandConnection.__new__(upyre.PythonRemoteCommandConnection)
+        command._raw_data = {"type": command.TYPE, "source": "local", "dest": "unreal", "data": {}}
+        command.cmd_connection = client
+        self.conn = types.SimpleNamespace(remote_command_connection=command, close_connection=client.close)
+        self.connection = UnrealConnection()
+
+    def reply(self, chunks: list[bytes], delay: float) -> threading.Thread:
+        """Read the command from Unreal's side, then send chunks with delay seconds between them."""
+
+        def run():
+            self.unreal.recv(1 << 16)
+            for chunk in chunks:
+                time.sleep(delay)
+                try:
+                    self.unreal.sendall(chunk)
+                except OSError:
+                    return
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        self.addCleanup(thread.join)
+        return thread
+
+    def test_reassembles_result_split_across_reads(self):
+        echo = _message("command", {"command": "print(1)"})
+        result = _message("command_result", {"success": True, "result": "None", "output": [{"type": "Info", "output": "1"}]})
+        self.reply([echo, result[:10], result[10:25], result[25:]], delay=0.05)
+
+        output = self.connection._run_command(self.conn, "print(1)", timeout=5.0)
+
+        self.assertTrue(output.success)
+        self.assertEqual(output.output, [{"type": "Info", "output": "1"}])
+
+    def test_deadline_covers_the_whole_reply(self):
+        # Each chunk arrives well within the timeout, but the reply as a whole does not
+        result = _message("command_result", {"success": True, "result": "x" * 200})
+        self.reply([result[i:i + 10] for i in range(0, len(result), 10)], delay=0.05)
+
+        start = time.monotonic()
+        with self.assertRaises(socket.timeout):
+            self.connection._run_command(self.conn, "pass", timeout=0.3)
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_closed_connection_raises(self):
+        self.reply([_message("command_result", {})[:5]], delay=0)
+        threading.Timer(0.1, self.unreal.shutdown, args=(socket.SHUT_WR,)).start()
+
+        with self.assertRaises(ConnectionError):
+            self.connection._run_command(self.conn, "pass", timeout=5.0)
+
+    def test_execute_reports_timeout_and_drops_connection(self):
+        self.reply([], delay=0)
+        self.connection._conn = self.conn
+        self.connection._ensure_connected = lambda: self.conn
+
+        output = self.connection.execute("pass", timeout=0.2)
+
+        self.assertEqual(output, "Error: Execution timed out after 0.2 seconds.")
+        self.assertIsNone(self.connection._conn)
+
+
+class BulkTimeoutTest(unittest.TestCase):
+    def test_bulk_fetches_get_a_longer_deadline(self):
+        connection = UnrealConnection(timeout=5.0)
+        with mock.patch.object(connection, "_call_helper", return_value="Error") as call_helper:
+            connection.fetch_toc()
+            connection.fetch_class_docs(["Actor"])
+            connection.fetch_classes_basic_info(["Actor"])
+            connection.fetch_class_doc("Actor")
+
+        timeouts = [call.args[1] if len(call.args) > 1 else None for call in call_helper.call_args_list]
+        self.assertEqual(timeouts, [TOC_TIMEOUT, BATCH_TIMEOUT, BATCH_TIMEOUT, None])
+
+    def test_longer_configured_timeout_wins(self):
+        connection = UnrealConnection(timeout=600.0)
+        with mock.patch.object(connection, "_call_helper", return_value="Error") as call_helper:
+            connection.fetch_toc()
+
+        self.assertEqual(call_helper.call_args.args[1], 600.0)
+
+
+class DiscoverySocketTest(unittest.TestCase):
+    """Discovery over loopback UDP, with a pre-opened socket standing in for the multicast one."""
+
+    def setUp(self):
+        self.unreal = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.unreal.bind(("127.0.0.1", 0))
+        self.unreal.settimeout(5.0)
+        self.addCleanup(self.unreal.close)
+
+        self.connection = UnrealConnection()
+        self.addCleanup(self.connection.close)
+        self.connection._config.MULTICAST_GROUP = self.unreal.getsockname()
+        self.discovery = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.discovery.bind(("127.0.0.1", 0))
+        self.discovery.setblocking(False)
+        self.connection._mcastsock = self.discovery
+
+    def answer_ping(self):
+        def run():
+            _, address = self.unreal.recvfrom(1 << 16)
+            pong = {"type": "pong", "source": "node", "data": {"project_name": "Sample", "engine_version": "5.7"}}
+            self.unreal.sendto(json.dumps(pong).encode(), address)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        self.addCleanup(thread.join)
+
+    def test_socket_kept_between_discoveries_where_supported(self):
+        self.answer_ping()
+        with mock.patch.object(unreal_connection, "KEEP_DISCOVERY_SOCKET", True):
+            instances = self.connection._discover_instances(timeout=2.0)
+
+        self.assertEqual([instance["project_name"] for instance in instances], ["Sample"])
+        self.assertIs(self.connection._mcastsock, self.discovery)
+
+    def test_socket_closed_after_discovery_elsewhere(self):
+        self.answer_ping()
+        with mock.patch.object(unreal_connection, "KEEP_DISCOVERY_SOCKET", False):
+            instances = self.connection._discover_instances(timeout=2.0)
+
+        self.assertEqual(len(instances), 1)
+        self.assertIsNone(self.connection._mcastsock)
+        self.assertEqual(self.discovery.fileno(), -1)
+
+    def test_socket_closed_before_command_connection_binds_the_port(self):
+        seen = []
+        connection = self.connection
+
+        class FakeRemoteConnection:
+            def __init__(self, config):
+                seen.append(connection._mcastsock)
+                self.mcastsock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+            def open_connection(self):
+                raise upyre.ConnectionError("Connection failed.")
+
+        with mock.patch.object(upyre, "PythonRemoteConnection", FakeRemoteConnection):
+            output = connection.execute("pass")
+
+        self.assertTrue(output.startswith("Error: Could not connect to Unreal Editor."))
+        self.assertEqual(seen, [None])
+        self.assertEqual(self.discovery.fileno(), -1)
+
+
+class HelperInstallTest(unittest.TestCase):
+    """_call_helper against a scripted editor, which answers each command from a list of handlers."""
+
+    def setUp(self):
+        self.connection = UnrealConnection()
+        self.install_code, self.version = unreal_connection._helpers_install_code()
+        self.commands = []
+        self.install_output = f"{unreal_connection._HELPERS_INSTALLED} {self.version}"
+        self.connection._execute_locked = self.execute_locked
+
+    def execute_locked(self, code, timeout=None):
+        self.assertTrue(self.connection._lock.locked())
+        is_install = code == self.install_code
+        self.commands.append("install" if is_install else "call")
+        if is_install:
+            return self.install_output
+        return "result"
+
+    def test_installs_once(self):
+        self.assertEqual(self.connection._call_helper("class_doc('Actor')"), "result")
+        self.assertEqual(self.connection._call_helper("class_doc('Actor')"), "result")
+
+        self.assertEqual(self.commands, ["install", "call", "call"])
+        self.assertTrue(self.connection._helpers_installed)
+
+    def test_failed_install_is_not_remembered(self):
+        self.install_output = "Execution failed: SyntaxError"
+        output = self.connection._call_helper("class_doc('Actor')")
+
+        self.assertTrue(output.startswith("Error"))
+        self.assertFalse(self.connection._helpers_installed)
+        self.assertEqual(self.commands, ["install"])
+
+        self.install_output = f"{unreal_connection._HELPERS_INSTALLED} {self.version}"
+        self.assertEqual(self.connection._call_helper("class_doc('Actor')"), "result")
+        self.assertEqual(self.commands, ["install", "install", "call"])
+
+    def test_outdated_install_is_not_accepted(self):
+        self.install_output = f"{unreal_connection._HELPERS_INSTALLED} 00000000"
+        self.assertTrue(self.connection._call_helper("class_doc('Actor')").startswith("Error"))
+        self.assertFalse(self.connection._helpers_installed)
+
+    def test_concurrent_calls_install_once(self):
+        threads = [threading.Thread(target=self.connection._call_helper, args=("class_doc('Actor')",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.commands.count("install"), 1)
+        self.assertEqual(self.commands.count("call"), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()